@@ -19,47 +19,107 @@ import os
 import sys
 import time
 import json
-import subprocess
+import atexit
+import asyncio
+from collections import OrderedDict
 from datetime import datetime
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
-
-# Usage tracking
+from slack_sdk.http_retry.builtin_handlers import (
+    ConnectionErrorRetryHandler,
+    RateLimitErrorRetryHandler,
+)
+from slack_sdk.socket_mode import SocketModeClient
+from slack_sdk.socket_mode.response import SocketModeResponse
+
+# Usage tracking — kept resident in memory, flushed lazily so each
+# command doesn't pay two JSON disk round-trips.
 USAGE_FILE = "/Users/lucaswillett/projects/support-memory/command_usage.json"
+USAGE_FLUSH_INTERVAL = 60
 
-def load_usage():
-    """Load command usage counts."""
-    try:
-        with open(USAGE_FILE) as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        return {}
+_usage = None
+_usage_dirty = False
 
-def save_usage(usage):
-    """Save command usage counts."""
+def load_usage():
+    """Load command usage counts (read from disk once, then cached)."""
+    global _usage
+    if _usage is None:
+        try:
+            with open(USAGE_FILE) as f:
+                _usage = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            _usage = {}
+    return _usage
+
+def save_usage():
+    """Write usage counts back to disk if they changed."""
+    global _usage_dirty
+    if not _usage_dirty or _usage is None:
+        return
     try:
         with open(USAGE_FILE, 'w') as f:
-            json.dump(usage, f, indent=2)
+            json.dump(_usage, f, indent=2)
+        _usage_dirty = False
     except Exception:
         pass
 
 def track_usage(cmd):
-    """Increment usage count for a command."""
+    """Increment usage count for a command (flushed lazily)."""
+    global _usage_dirty
     usage = load_usage()
     usage[cmd] = usage.get(cmd, 0) + 1
-    save_usage(usage)
+    _usage_dirty = True
+
+atexit.register(save_usage)
+
+
+async def flush_usage_periodically():
+    """Background task: flush dirty usage counts every minute."""
+    while True:
+        await asyncio.sleep(USAGE_FLUSH_INTERVAL)
+        save_usage()
 
 # Config
 SLACK_BOT_TOKEN = os.environ.get('SLACK_BOT_TOKEN')
+SLACK_APP_TOKEN = os.environ.get('SLACK_APP_TOKEN')  # xapp-... enables Socket Mode
 COMMAND_CHANNEL = "C0AFPAQ0KMF"  # #lucas-briefing
 LUCAS_USER_ID = "U9NLNTPDK"
 
 # Only allow commands from Lucas
 ALLOWED_USERS = [LUCAS_USER_ID]
 
+# Queue consumers — how many commands may run concurrently
+NUM_WORKERS = 4
+
 # Base paths
 SUPPORT_MEMORY_DIR = "/Users/lucaswillett/projects/support-memory"
 HELP_CENTER_DIR = f"{SUPPORT_MEMORY_DIR}/help-center"
+
+# Last-processed message timestamp, persisted across restarts so startup
+# doesn't need a history fetch just to skip old messages.
+LAST_TS_FILE = f"{SUPPORT_MEMORY_DIR}/.command_bot_last_ts"
+
+# Import the task/Zapier helpers once at startup instead of paying
+# sys.path mutation + import machinery inside every handler call.
+sys.path.insert(0, SUPPORT_MEMORY_DIR)
+sys.path.insert(0, f"{SUPPORT_MEMORY_DIR}/browser")
+
+try:
+    from google_tasks import (
+        get_all_tasks_by_category,
+        complete_task_by_title,
+        find_task_by_title,
+        create_task,
+    )
+    GOOGLE_TASKS_OK = True
+except ImportError:
+    GOOGLE_TASKS_OK = False
+
+try:
+    from zapier_status import get_zap_status, format_for_slack
+    ZAPIER_OK = True
+except ImportError:
+    ZAPIER_OK = False
 PYTHON = "/Library/Frameworks/Python.framework/Versions/3.13/bin/python3"
 
 # Available commands
@@ -114,7 +174,67 @@ COMMANDS = {
     },
 }
 
-client = WebClient(token=SLACK_BOT_TOKEN)
+# Service lists are static — build them once at import instead of per call
+SERVICES_BRIEF = (
+    ("slack-listener", "com.supportmemory.slack-listener"),
+    ("morning-briefing", "com.supportmemory.morning-briefing"),
+    ("article-pipeline", "com.supportmemory.article-pipeline"),
+)
+
+SERVICES_FULL = (
+    ("Slack Listener", "com.supportmemory.slack-listener"),
+    ("Morning Briefing", "com.supportmemory.morning-briefing"),
+    ("Article Pipeline", "com.supportmemory.article-pipeline"),
+    ("ChurnZero Bot", "com.churnzero.slack-bot"),
+    ("Redirect Bot", "com.redirect.slack-bot"),
+)
+
+# Brief status text keyed on whether the job has a live PID
+BRIEF_STATE = {True: "🟢 running", False: "🔴 stopped"}
+
+# O(1) dispatch table built from COMMANDS at import time: first token →
+# info dict, or a nested {second_token: info} dict for "run watcher"
+# style commands. Info dicts are distinguished by their 'handler' key.
+DISPATCH = {}
+for _key, _info in COMMANDS.items():
+    _tokens = _key.split(' ', 1)
+    if len(_tokens) == 1:
+        DISPATCH[_tokens[0]] = _info
+    else:
+        DISPATCH.setdefault(_tokens[0], {})[_tokens[1]] = _info
+
+
+def resolve_command(cmd_text):
+    """Look up a command by token instead of scanning COMMANDS.
+
+    Returns (name, info, args) or (None, None, None) if unknown.
+    """
+    parts = cmd_text.split(' ', 2)
+    entry = DISPATCH.get(parts[0])
+    if entry is None:
+        return None, None, None
+    if 'handler' in entry:
+        name = parts[0]
+    elif len(parts) > 1 and parts[1] in entry:
+        entry = entry[parts[1]]
+        name = f"{parts[0]} {parts[1]}"
+    else:
+        return None, None, None
+    args = cmd_text[len(name):].strip() or None
+    return name, entry, args
+
+
+# One WebClient for the life of the process. Note: the sync WebClient is
+# urllib-based and opens a fresh connection per request, so TLS reuse
+# isn't on the table here — the retry handlers only make transient
+# connection errors and rate limits recover automatically.
+client = WebClient(
+    token=SLACK_BOT_TOKEN,
+    retry_handlers=[
+        ConnectionErrorRetryHandler(max_retry_count=2),
+        RateLimitErrorRetryHandler(max_retry_count=3),
+    ],
+)
 
 
 def post_reply(text, thread_ts):
@@ -129,59 +249,189 @@ def post_reply(text, thread_ts):
         print(f"Error posting: {e}")
 
 
-def run_script(script_path, args=None, timeout=60):
-    """Run a Python script and return output."""
+# Block Kit template for the multi-line status replies — Slack renders
+# blocks faster than re-parsing markdown out of text=. Built once here;
+# handlers only swap in the section text.
+STATUS_BLOCK_TEMPLATE = {"type": "section", "text": {"type": "mrkdwn", "text": ""}}
+
+
+def post_status_blocks(text, thread_ts):
+    """Post a status reply as a single precomposed Block Kit section."""
+    block = dict(STATUS_BLOCK_TEMPLATE)
+    block["text"] = {"type": "mrkdwn", "text": text}
+    try:
+        client.chat_postMessage(
+            channel=COMMAND_CHANNEL,
+            blocks=[block],
+            text=text,  # notification fallback
+            thread_ts=thread_ts
+        )
+    except SlackApiError as e:
+        print(f"Error posting: {e}")
+
+
+async def run_script(script_path, args=None, timeout=60):
+    """Run a Python script without blocking the event loop; return output."""
     cmd = [PYTHON, script_path]
     if args:
         cmd.extend(args)
 
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
             cwd=os.path.dirname(script_path)
         )
-        output = result.stdout
-        if result.stderr:
-            output += f"\n{result.stderr}"
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            return "⚠️ Command timed out"
+        output = stdout.decode()
+        if stderr:
+            output += f"\n{stderr.decode()}"
         return output.strip() or "(no output)"
-    except subprocess.TimeoutExpired:
-        return "⚠️ Command timed out"
     except Exception as e:
         return f"❌ Error: {e}"
 
 
-def cmd_status(thread_ts):
+async def run_script_streaming(script_path, thread_ts, args=None, timeout=60):
+    """Run a script, live-editing a single progress reply as output arrives.
+
+    Posts one placeholder message, then uses chat.update every few
+    seconds with the tail of the output — the user sees progress on long
+    scripts without the bot spamming extra replies.
+    """
+    cmd = [PYTHON, script_path]
+    if args:
+        cmd.extend(args)
+
+    try:
+        posted = client.chat_postMessage(
+            channel=COMMAND_CHANNEL,
+            text="```\n(running...)\n```",
+            thread_ts=thread_ts
+        )
+        progress_ts = posted['ts']
+    except SlackApiError as e:
+        print(f"Error posting: {e}")
+        return
+
+    buf = []
+    last_update = time.time()
+    deadline = last_update + timeout
+
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            cwd=os.path.dirname(script_path)
+        )
+        while True:
+            try:
+                line = await asyncio.wait_for(
+                    proc.stdout.readline(), deadline - time.time())
+            except asyncio.TimeoutError:
+                proc.kill()
+                buf.append("⚠️ Command timed out\n")
+                break
+            if not line:
+                break
+            buf.append(line.decode())
+            if time.time() - last_update > 5:
+                try:
+                    client.chat_update(
+                        channel=COMMAND_CHANNEL,
+                        ts=progress_ts,
+                        text="```\n" + ''.join(buf[-40:]).strip() + "\n```"
+                    )
+                except SlackApiError:
+                    pass
+                last_update = time.time()
+        await proc.wait()
+    except Exception as e:
+        buf.append(f"❌ Error: {e}\n")
+
+    output = ''.join(buf).strip() or "(no output)"
+    if len(output) > 2500:
+        output = output[:2500] + "\n...(truncated)"
+    try:
+        client.chat_update(
+            channel=COMMAND_CHANNEL,
+            ts=progress_ts,
+            text=f"```\n{output}\n```"
+        )
+    except SlackApiError as e:
+        print(f"Error posting: {e}")
+
+
+async def launchctl_jobs():
+    """Dump all launchd jobs in one call; return {label: (pid, exit_code)}.
+
+    One fork+exec instead of one per service — handlers dict-lookup the
+    labels they care about.
+    """
+    proc = await asyncio.create_subprocess_exec(
+        "launchctl", "list",
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.DEVNULL,
+    )
+    stdout, _ = await proc.communicate()
+    jobs = {}
+    for line in stdout.decode().splitlines()[1:]:  # skip header row
+        parts = line.split('\t')
+        if len(parts) >= 3:
+            jobs[parts[2]] = (parts[0], parts[1])
+    return jobs
+
+
+# Short-TTL cache for idempotent status commands — a double-tap inside
+# the window replays the last reply instead of re-running subprocesses.
+STATUS_CACHE_TTL = 5
+_status_cache = {}
+
+
+def cached_reply(name, thread_ts):
+    """Replay a recent cached reply if fresh; return True if it hit."""
+    entry = _status_cache.get(name)
+    if entry and time.time() - entry[0] < STATUS_CACHE_TTL:
+        post_status_blocks(entry[1], thread_ts)
+        return True
+    return False
+
+
+def cache_and_reply(name, text, thread_ts):
+    """Store a reply in the TTL cache and post it as blocks."""
+    _status_cache[name] = (time.time(), text)
+    post_status_blocks(text, thread_ts)
+
+
+async def cmd_status(thread_ts):
     """Show system status."""
+    if cached_reply('status', thread_ts):
+        return
+
     status = []
     status.append("*System Status*\n")
 
-    # Check launchd services
-    services = [
-        ("slack-listener", "com.supportmemory.slack-listener"),
-        ("morning-briefing", "com.supportmemory.morning-briefing"),
-        ("article-pipeline", "com.supportmemory.article-pipeline"),
-    ]
+    # Run the launchd dump and the pipeline shell-out in parallel —
+    # wall time is the slowest child, not the sum.
+    jobs, pipeline_output = await asyncio.gather(
+        launchctl_jobs(),
+        run_script(f"{HELP_CENTER_DIR}/process_article_ideas.py", ["status"], timeout=15),
+    )
 
     status.append("*Services:*")
-    for name, label in services:
-        result = subprocess.run(
-            ["launchctl", "list", label],
-            capture_output=True, text=True
-        )
-        if result.returncode == 0:
-            # Parse PID and exit code
-            parts = result.stdout.strip().split('\t')
-            pid = parts[0] if parts[0] != '-' else 'stopped'
-            status.append(f"  • {name}: {'🟢 running' if pid != 'stopped' else '🔴 stopped'}")
+    for name, label in SERVICES_BRIEF:
+        if label in jobs:
+            status.append(f"  • {name}: {BRIEF_STATE[jobs[label][0] != '-']}")
         else:
             status.append(f"  • {name}: ⚪ not loaded")
 
     # Pipeline status
     status.append("\n*Article Pipeline:*")
-    pipeline_output = run_script(f"{HELP_CENTER_DIR}/process_article_ideas.py", ["status"], timeout=15)
     for line in pipeline_output.split('\n'):
         if 'inbox' in line.lower() or 'draft' in line.lower() or 'review' in line.lower():
             status.append(f"  {line.strip()}")
@@ -189,60 +439,47 @@ def cmd_status(thread_ts):
     # Timestamp
     status.append(f"\n_Updated: {datetime.now().strftime('%Y-%m-%d %H:%M')}_")
 
-    post_reply('\n'.join(status), thread_ts)
+    cache_and_reply('status', '\n'.join(status), thread_ts)
 
 
-def cmd_run_watcher(thread_ts):
+async def cmd_run_watcher(thread_ts):
     """Run the folder watcher."""
     post_reply("🔍 Running folder watcher...", thread_ts)
-    output = run_script(f"{HELP_CENTER_DIR}/folder_watcher.py", timeout=30)
-    post_reply(f"```\n{output}\n```", thread_ts)
+    await run_script_streaming(f"{HELP_CENTER_DIR}/folder_watcher.py", thread_ts, timeout=30)
 
 
-def cmd_run_pipeline(thread_ts):
+async def cmd_run_pipeline(thread_ts):
     """Run the article pipeline processor."""
     post_reply("📝 Processing article ideas...", thread_ts)
-    output = run_script(f"{HELP_CENTER_DIR}/process_article_ideas.py", timeout=60)
-    post_reply(f"```\n{output}\n```", thread_ts)
+    await run_script_streaming(f"{HELP_CENTER_DIR}/process_article_ideas.py", thread_ts, timeout=60)
 
 
-def cmd_run_briefing(thread_ts):
+async def cmd_run_briefing(thread_ts):
     """Generate morning briefing preview."""
     post_reply("☀️ Generating briefing preview...", thread_ts)
-    output = run_script(f"{SUPPORT_MEMORY_DIR}/morning_briefing.py", timeout=30)
-    # Truncate if too long
-    if len(output) > 2500:
-        output = output[:2500] + "\n...(truncated)"
-    post_reply(f"```\n{output}\n```", thread_ts)
+    await run_script_streaming(f"{SUPPORT_MEMORY_DIR}/morning_briefing.py", thread_ts, timeout=30)
 
 
-def cmd_tasks(thread_ts):
+async def cmd_tasks(thread_ts):
     """Show pipeline status from folder watcher."""
-    output = run_script(f"{HELP_CENTER_DIR}/folder_watcher.py", ["status"], timeout=15)
-    post_reply(f"*Article Pipeline Status:*\n```\n{output}\n```", thread_ts)
+    if cached_reply('tasks', thread_ts):
+        return
+    output = await run_script(f"{HELP_CENTER_DIR}/folder_watcher.py", ["status"], timeout=15)
+    cache_and_reply('tasks', f"*Article Pipeline Status:*\n```\n{output}\n```", thread_ts)
 
 
-def cmd_services(thread_ts):
+async def cmd_services(thread_ts):
     """Show detailed launchd service status."""
+    if cached_reply('services', thread_ts):
+        return
+
     status = ["*LaunchD Services:*\n"]
 
-    services = [
-        ("Slack Listener", "com.supportmemory.slack-listener"),
-        ("Morning Briefing", "com.supportmemory.morning-briefing"),
-        ("Article Pipeline", "com.supportmemory.article-pipeline"),
-        ("ChurnZero Bot", "com.churnzero.slack-bot"),
-        ("Redirect Bot", "com.redirect.slack-bot"),
-    ]
-
-    for name, label in services:
-        result = subprocess.run(
-            ["launchctl", "list", label],
-            capture_output=True, text=True
-        )
-        if result.returncode == 0:
-            parts = result.stdout.strip().split('\t')
-            pid = parts[0] if len(parts) > 0 else '-'
-            exit_code = parts[1] if len(parts) > 1 else '-'
+    jobs = await launchctl_jobs()
+
+    for name, label in SERVICES_FULL:
+        if label in jobs:
+            pid, exit_code = jobs[label]
 
             if pid != '-':
                 status.append(f"🟢 *{name}*: running (PID {pid})")
@@ -253,10 +490,10 @@ def cmd_services(thread_ts):
         else:
             status.append(f"⚪ *{name}*: not loaded")
 
-    post_reply('\n'.join(status), thread_ts)
+    cache_and_reply('services', '\n'.join(status), thread_ts)
 
 
-def cmd_help(thread_ts):
+async def cmd_help(thread_ts):
     """Show help, sorted by usage frequency."""
     usage = load_usage()
 
@@ -276,19 +513,19 @@ def cmd_help(thread_ts):
     post_reply(help_text, thread_ts)
 
 
-def cmd_heartbeat(thread_ts):
+async def cmd_heartbeat(thread_ts):
     """Send heartbeat check-in."""
-    output = run_script(f"{SUPPORT_MEMORY_DIR}/heartbeat.py", ["heartbeat"], timeout=30)
+    output = await run_script(f"{SUPPORT_MEMORY_DIR}/heartbeat.py", ["heartbeat"], timeout=30)
     post_reply("💓 Heartbeat sent to channel.", thread_ts)
 
 
-def cmd_gtasks(thread_ts):
+async def cmd_gtasks(thread_ts):
     """Show open Google Tasks by category."""
-    try:
-        import sys
-        sys.path.insert(0, SUPPORT_MEMORY_DIR)
-        from google_tasks import get_all_tasks_by_category
+    if not GOOGLE_TASKS_OK:
+        post_reply("Error fetching tasks: google_tasks not available", thread_ts)
+        return
 
+    try:
         categories = get_all_tasks_by_category()
         if categories:
             total = sum(len(t) for t in categories.values())
@@ -312,17 +549,17 @@ def cmd_gtasks(thread_ts):
         post_reply(f"Error fetching tasks: {e}", thread_ts)
 
 
-def cmd_done_task(thread_ts, search_text=None):
+async def cmd_done_task(thread_ts, search_text=None):
     """Complete a task by partial title match."""
     if not search_text:
         post_reply("Usage: `!done [search term]`\nExample: `!done zendesk` to complete task containing 'zendesk'", thread_ts)
         return
 
-    try:
-        import sys
-        sys.path.insert(0, SUPPORT_MEMORY_DIR)
-        from google_tasks import complete_task_by_title, find_task_by_title
+    if not GOOGLE_TASKS_OK:
+        post_reply("Error: google_tasks not available", thread_ts)
+        return
 
+    try:
         # First show what we found
         task, list_id = find_task_by_title(search_text)
         if not task:
@@ -339,17 +576,17 @@ def cmd_done_task(thread_ts, search_text=None):
         post_reply(f"Error: {e}", thread_ts)
 
 
-def cmd_add_task(thread_ts, task_title=None):
+async def cmd_add_task(thread_ts, task_title=None):
     """Add a new Google Task."""
     if not task_title:
         post_reply("Usage: `!add [task title]`\nExample: `!add Review Q1 metrics`", thread_ts)
         return
 
-    try:
-        import sys
-        sys.path.insert(0, SUPPORT_MEMORY_DIR)
-        from google_tasks import create_task
+    if not GOOGLE_TASKS_OK:
+        post_reply("Error: google_tasks not available", thread_ts)
+        return
 
+    try:
         result = create_task(task_title)
         if result:
             post_reply(f"✅ Added task: *{task_title}*", thread_ts)
@@ -359,14 +596,14 @@ def cmd_add_task(thread_ts, task_title=None):
         post_reply(f"Error: {e}", thread_ts)
 
 
-def cmd_zaps(thread_ts):
+async def cmd_zaps(thread_ts):
     """Show Zapier status via Playwright."""
     post_reply("🔌 Checking Zapier status...", thread_ts)
-    try:
-        import sys
-        sys.path.insert(0, f"{SUPPORT_MEMORY_DIR}/browser")
-        from zapier_status import get_zap_status, format_for_slack
+    if not ZAPIER_OK:
+        post_reply("Error: zapier_status not available\n\nTo set up: `python session_manager.py save zapier`", thread_ts)
+        return
 
+    try:
         results = get_zap_status()
         output = format_for_slack(results)
         post_reply(output, thread_ts)
@@ -376,74 +613,207 @@ def cmd_zaps(thread_ts):
 
 class CommandBot:
     def __init__(self):
-        self.processed_messages = set()
+        # Bounded LRU of seen message timestamps — a plain set grows
+        # for the life of the process.
+        self.processed_messages = OrderedDict()
+        self.last_seen_ts = self.load_last_seen_ts()
+        self.inflight = {}  # cmd name -> running handler task
+        self.queue = None  # producer -> worker handoff, built on the loop
+        self.loop = None
+        # Resolve the bot user id once at startup instead of lazily on
+        # every poll (a failed lazy lookup used to retry per cycle).
         self.bot_user_id = None
-
-    def get_bot_user_id(self):
-        if not self.bot_user_id:
+        for _ in range(3):
             try:
-                result = client.auth_test()
-                self.bot_user_id = result['user_id']
+                self.bot_user_id = client.auth_test()['user_id']
+                break
             except SlackApiError:
-                pass
-        return self.bot_user_id
+                time.sleep(1)
+
+    def load_last_seen_ts(self):
+        """Read the persisted high-water mark (or "0" on first run)."""
+        try:
+            with open(LAST_TS_FILE) as f:
+                return f.read().strip() or "0"
+        except Exception:
+            return "0"
+
+    def save_last_seen_ts(self):
+        """Persist the high-water mark for the next restart."""
+        try:
+            with open(LAST_TS_FILE, 'w') as f:
+                f.write(self.last_seen_ts)
+        except Exception:
+            pass
+
+    def mark_processed(self, msg_ts, max_entries=1024):
+        """Remember a message ts, evicting the oldest past max_entries."""
+        self.processed_messages[msg_ts] = None
+        self.processed_messages.move_to_end(msg_ts)
+        if len(self.processed_messages) > max_entries:
+            self.processed_messages.popitem(last=False)
+
+    async def handle_message(self, msg):
+        """Process one Slack message dict (from poll or Socket Mode push)."""
+        bot_id = self.bot_user_id
+
+        msg_ts = msg.get('ts')
+        text = msg.get('text', '').strip()
+        user = msg.get('user', '')
+
+        # Skip if already processed, from bot, or not a command
+        if msg_ts in self.processed_messages:
+            return
+
+        # Advance the in-memory high-water mark for every message seen so
+        # the oldest= filter stops re-fetching plain chat traffic; only
+        # commands are worth a disk write.
+        if msg_ts and msg_ts > self.last_seen_ts:
+            self.last_seen_ts = msg_ts
+
+        if user == bot_id or msg.get('bot_id'):
+            return
+        if not text.startswith('!'):
+            return
+
+        self.mark_processed(msg_ts)
+        self.save_last_seen_ts()
+
+        # Check authorization
+        if user not in ALLOWED_USERS:
+            post_reply("⛔ Unauthorized. Commands are restricted.", msg_ts)
+            return
+
+        # Parse command
+        cmd_text = text[1:].lower().strip()  # Remove ! prefix
+
+        # Find matching command — two dict lookups, no prefix scan
+        cmd, info, args = resolve_command(cmd_text)
+        if cmd:
+            # Hand off to the worker pool so a slow command (e.g.
+            # !run briefing) doesn't block the next one.
+            await self.queue.put((cmd, info, args, msg_ts))
+        else:
+            post_reply(f"❓ Unknown command: `{text}`\nType `!help` for available commands.", msg_ts)
+
+    async def dispatch(self, cmd, info, args, msg_ts):
+        """Run one queued command."""
+        print(f"[{datetime.now().strftime('%H:%M:%S')}] Running: !{cmd}")
+        track_usage(cmd)  # Track usage for sorting
+
+        # Coalesce rapid-fire duplicates: ride the in-flight handler
+        # instead of spawning another copy, then reply from the TTL
+        # cache once it lands. Key on args too — `!done zendesk` must not
+        # swallow a concurrent `!done meeting`.
+        key = f"{cmd} {args}" if args else cmd
+        running = self.inflight.get(key)
+        if running is not None and not running.done():
+            await asyncio.wait({running})
+            if not cached_reply(cmd, msg_ts):
+                post_reply(f"⏳ `!{cmd}` just ran — see the reply above.", msg_ts)
+            return
+
+        # Drop finished entries so arg-keyed commands don't accumulate
+        for done_key in [k for k, t in self.inflight.items() if t.done()]:
+            del self.inflight[done_key]
+
+        handler = globals()[info['handler']]
+        if args and cmd in ('done', 'add'):
+            task = asyncio.ensure_future(handler(msg_ts, args))
+        else:
+            task = asyncio.ensure_future(handler(msg_ts))
+        self.inflight[key] = task
+        await task
 
-    def check_for_commands(self):
-        """Check for new commands."""
-        bot_id = self.get_bot_user_id()
+    async def worker(self):
+        """Queue consumer: pull commands and dispatch them."""
+        while True:
+            cmd, info, args, msg_ts = await self.queue.get()
+            try:
+                await self.dispatch(cmd, info, args, msg_ts)
+            except Exception as e:
+                print(f"Error: {e}")
+            finally:
+                self.queue.task_done()
 
+    async def check_for_commands(self):
+        """Check for new commands (polling fallback)."""
         try:
+            # Let Slack filter server-side: only messages newer than the
+            # high-water mark come back (usually none).
             result = client.conversations_history(
                 channel=COMMAND_CHANNEL,
-                limit=10
+                oldest=self.last_seen_ts,
+                limit=100
             )
 
             for msg in result.get('messages', []):
-                msg_ts = msg.get('ts')
-                text = msg.get('text', '').strip()
-                user = msg.get('user', '')
-
-                # Skip if already processed, from bot, or not a command
-                if msg_ts in self.processed_messages:
-                    continue
-                if user == bot_id or msg.get('bot_id'):
-                    continue
-                if not text.startswith('!'):
-                    continue
-
-                self.processed_messages.add(msg_ts)
-
-                # Check authorization
-                if user not in ALLOWED_USERS:
-                    post_reply("⛔ Unauthorized. Commands are restricted.", msg_ts)
-                    continue
-
-                # Parse command
-                cmd_text = text[1:].lower().strip()  # Remove ! prefix
-
-                # Find matching command
-                matched = False
-                for cmd, info in COMMANDS.items():
-                    if cmd_text == cmd or cmd_text.startswith(cmd + ' '):
-                        print(f"[{datetime.now().strftime('%H:%M:%S')}] Running: !{cmd}")
-                        track_usage(cmd)  # Track usage for sorting
-                        handler = globals()[info['handler']]
-                        # Extract arguments (everything after the command)
-                        args = cmd_text[len(cmd):].strip() if cmd_text.startswith(cmd + ' ') else None
-                        if args and cmd in ['done', 'add']:
-                            handler(msg_ts, args)
-                        else:
-                            handler(msg_ts)
-                        matched = True
-                        break
-
-                if not matched:
-                    post_reply(f"❓ Unknown command: `{text}`\nType `!help` for available commands.", msg_ts)
+                await self.handle_message(msg)
 
         except SlackApiError as e:
             print(f"Error: {e}")
 
-    def run(self, poll_interval=3):
+    def handle_socket_request(self, socket_client, req):
+        """Socket Mode listener: ack the envelope, dispatch message events."""
+        socket_client.send_socket_mode_response(
+            SocketModeResponse(envelope_id=req.envelope_id)
+        )
+
+        if req.type != 'events_api':
+            return
+
+        event = req.payload.get('event', {})
+        if event.get('type') != 'message' or event.get('channel') != COMMAND_CHANNEL:
+            return
+        # Slack marks our own messages with bot_id — drop them here
+        # without any API round-trip.
+        if event.get('bot_id'):
+            return
+
+        # The Socket Mode client calls listeners from its own thread;
+        # hand the coroutine to the main event loop.
+        asyncio.run_coroutine_threadsafe(self.handle_message(event), self.loop)
+
+    async def run_socket_mode(self):
+        """Listen for commands over a Socket Mode WebSocket (no polling)."""
+        socket_client = SocketModeClient(
+            app_token=SLACK_APP_TOKEN,
+            web_client=client,
+        )
+        socket_client.socket_mode_request_listeners.append(self.handle_socket_request)
+        socket_client.connect()
+        print("Connected via Socket Mode. Listening for commands...")
+        try:
+            await asyncio.Event().wait()
+        finally:
+            socket_client.disconnect()
+
+    async def run_polling(self, poll_interval=3):
+        """Poll conversations_history (fallback when no app token is set)."""
+        # Seed the high-water mark from disk; only ask Slack when this is
+        # a genuine first run with no persisted timestamp.
+        if self.last_seen_ts == "0":
+            try:
+                result = client.conversations_history(channel=COMMAND_CHANNEL, limit=1)
+                messages = result.get('messages', [])
+                if messages:
+                    self.last_seen_ts = messages[0].get('ts', "0")
+                    self.save_last_seen_ts()
+            except Exception as e:
+                print(f"Warning: {e}")
+        print(f"Starting from ts {self.last_seen_ts}")
+
+        print("Listening for commands...")
+
+        while True:
+            try:
+                await self.check_for_commands()
+                await asyncio.sleep(poll_interval)
+            except Exception as e:
+                print(f"Error: {e}")
+                await asyncio.sleep(poll_interval)
+
+    async def run(self, poll_interval=3):
         """Main loop."""
         print("=" * 50)
         print("COMMAND BOT")
@@ -453,29 +823,26 @@ class CommandBot:
         print(f"Authorized users: {len(ALLOWED_USERS)}")
         print("-" * 50)
 
-        # Mark existing messages as processed
-        try:
-            result = client.conversations_history(channel=COMMAND_CHANNEL, limit=50)
-            for msg in result.get('messages', []):
-                self.processed_messages.add(msg.get('ts'))
-            print(f"Skipped {len(self.processed_messages)} existing messages")
-        except Exception as e:
-            print(f"Warning: {e}")
+        # Subprocess transports must be set up on the main thread's loop —
+        # grab it here, at startup.
+        self.loop = asyncio.get_running_loop()
 
-        print("Listening for commands...")
+        self._usage_flusher = asyncio.create_task(flush_usage_periodically())
 
-        while True:
-            try:
-                self.check_for_commands()
-                time.sleep(poll_interval)
-            except KeyboardInterrupt:
-                print("\nBot stopped.")
-                break
-            except Exception as e:
-                print(f"Error: {e}")
-                time.sleep(poll_interval)
+        # Producer (Socket Mode push or poller) feeds the queue; a small
+        # worker pool consumes it so commands overlap.
+        self.queue = asyncio.Queue()
+        self._workers = [asyncio.create_task(self.worker()) for _ in range(NUM_WORKERS)]
+
+        if SLACK_APP_TOKEN:
+            await self.run_socket_mode()
+        else:
+            await self.run_polling(poll_interval)
 
 
 if __name__ == '__main__':
     bot = CommandBot()
-    bot.run()
+    try:
+        asyncio.run(bot.run())
+    except KeyboardInterrupt:
+        print("\nBot stopped.")
@@ -3,42 +3,102 @@ Support Council - Get multiple perspectives on a question
 Each voice weighs in from their lens, informed by shared memory
 """
 import json
+from collections import Counter
+from heapq import nlargest
+from operator import itemgetter
 from pathlib import Path
+from typing import NamedTuple
+
+# orjson serializes/parses several times faster than stdlib json; fall
+# back silently when it isn't installed
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+    def _dump_line(obj):
+        return orjson.dumps(obj) + b'\n'
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, indent=2)
+
+    def _dump_line(obj):
+        return (json.dumps(obj) + '\n').encode()
+
+    _loads = json.loads
 
 VOICES_DIR = Path(__file__).parent / "voices"
 VOICES = ["support", "gtm", "csm", "training", "help_center"]
 
+# mtime/size-keyed caches so convening the council re-reads persona
+# files and the memory JSON only when they actually change on disk
+_voice_cache = {}
+_memory_cache = {}
+
 
 def load_voice(voice_name):
-    """Load a voice's persona"""
+    """Load a voice's persona (cached until the file changes)"""
     voice_file = VOICES_DIR / f"{voice_name}.md"
-    if voice_file.exists():
-        return voice_file.read_text()
-    return None
+    try:
+        stat = voice_file.stat()
+    except FileNotFoundError:
+        return None
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _voice_cache.get(voice_name)
+    if cached and cached[0] == key:
+        return cached[1]
+    text = voice_file.read_text()
+    _voice_cache[voice_name] = (key, text)
+    return text
 
 
-def load_memory_context():
-    """Load shared memory for context"""
-    from shared_memory import load_memory, load_entities
-    return {
-        "memory": load_memory(),
-        "entities": load_entities()
-    }
+class MemoryContext(NamedTuple):
+    """Shared memory snapshot handed to each voice"""
+    memory: dict
+    entities: dict
 
 
-def format_council_prompt(question, voice_name):
+def load_memory_context():
+    """Load shared memory for context (cached until the files change)"""
+    from shared_memory import load_memory, load_entities, MEMORY_FILE, ENTITIES_FILE
+    try:
+        key = (MEMORY_FILE.stat().st_mtime_ns, ENTITIES_FILE.stat().st_mtime_ns)
+    except FileNotFoundError:
+        key = None
+    if key is not None and _memory_cache.get('key') == key:
+        return _memory_cache['context']
+    context = MemoryContext(load_memory(), load_entities())
+    if key is not None:
+        _memory_cache['key'] = key
+        _memory_cache['context'] = context
+    return context
+
+
+def format_shared_context(context):
+    """Serialize the shared-context block (same for every voice)"""
+    mem = context.memory
+    return (
+        f"Recent incidents: {_dumps(mem.get('incidents', [])[-3:])}\n"
+        f"Customer patterns: {_dumps(mem.get('customer_patterns', [])[-3:])}\n"
+        f"Recent decisions: {_dumps(mem.get('decisions', [])[-3:])}"
+    )
+
+
+def format_council_prompt(question, voice_name, shared_context=None):
     """Create prompt for a voice to weigh in"""
     persona = load_voice(voice_name)
-    context = load_memory_context()
+    if shared_context is None:
+        shared_context = format_shared_context(load_memory_context())
 
     return f"""You are the {voice_name.upper()} voice on a cross-functional council.
 
 {persona}
 
 ## Shared Context (what we know)
-Recent incidents: {json.dumps(context['memory'].get('incidents', [])[-3:], indent=2)}
-Customer patterns: {json.dumps(context['memory'].get('customer_patterns', [])[-3:], indent=2)}
-Recent decisions: {json.dumps(context['memory'].get('decisions', [])[-3:], indent=2)}
+{shared_context}
 
 ## Question for the council
 {question}
@@ -47,17 +107,41 @@ Respond in 2-3 sentences from your perspective. Be direct. State your view and w
 """
 
 
-def convene_council(question):
-    """Get all voices to weigh in on a question"""
+def iter_council_prompts(question):
+    """Yield (voice, prompt) pairs one at a time — peak memory is a
+    single prompt, however many voices are on the council"""
+    # Serialize the shared block once — it's identical for all voices
+    shared_context = format_shared_context(load_memory_context())
+    for voice in VOICES:
+        yield voice, format_council_prompt(question, voice, shared_context)
+
+
+def convene_council(question, output_file=None):
+    """Get all voices to weigh in on a question.
+
+    With output_file set, prompts are streamed to disk as JSONL (one
+    {"voice", "prompt"} object per line) instead of accumulated, and
+    None is returned.
+    """
     print(f"\n{'='*60}")
     print(f"COUNCIL QUESTION: {question}")
     print('='*60)
 
-    prompts = {}
-    for voice in VOICES:
-        prompts[voice] = format_council_prompt(question, voice)
-        print(f"\n[{voice.upper()}]")
-        print(f"(Prompt ready - {len(prompts[voice])} chars)")
+    prompts = None if output_file else {}
+    # Binary mode + C encoder keeps the write path off the str-encode
+    # round trip
+    out = open(output_file, 'wb') if output_file else None
+    try:
+        for voice, prompt in iter_council_prompts(question):
+            if out:
+                out.write(_dump_line({"voice": voice, "prompt": prompt}))
+            else:
+                prompts[voice] = prompt
+            print(f"\n[{voice.upper()}]")
+            print(f"(Prompt ready - {len(prompt)} chars)")
+    finally:
+        if out:
+            out.close()
 
     print(f"\n{'='*60}")
     print("To run: Send each prompt to Claude/GPT and collect responses")
@@ -67,10 +151,17 @@ def convene_council(question):
     return prompts
 
 
+# Row templates bound once — .format with positional slots beats
+# rebuilding the f-string machinery inside the loops
+_INC_FMT = "  - [{0}] {1}".format
+_RISK_FMT = "  - {0}: {1}, {2} tickets".format
+_THEME_FMT = "  - {0}: {1}".format
+
+
 def get_memory_summary():
     """Get a summary of current memory state for context."""
     context = load_memory_context()
-    mem = context['memory']
+    mem = context.memory
 
     summary = []
 
@@ -79,7 +170,7 @@ def get_memory_summary():
     if incidents:
         summary.append("Recent incidents:")
         for inc in incidents:
-            summary.append(f"  - [{inc.get('date')}] {inc.get('summary')}")
+            summary.append(_INC_FMT(inc.get('date'), inc.get('summary')))
 
     # Customer patterns
     patterns = mem.get('customer_patterns', [])
@@ -87,19 +178,17 @@ def get_memory_summary():
     if at_risk:
         summary.append(f"\nAt-risk customers ({len(at_risk)}):")
         for p in at_risk[:3]:
-            summary.append(f"  - {p.get('customer')}: {p.get('sentiment')}, {p.get('recent_tickets')} tickets")
+            summary.append(_RISK_FMT(p.get('customer'), p.get('sentiment'), p.get('recent_tickets')))
 
     # Theme summary from observations
     obs = mem.get('observations', [])
     if obs:
-        themes = {}
-        for o in obs[-50:]:  # Last 50 observations
-            for t in o.get('themes', []):
-                themes[t] = themes.get(t, 0) + 1
+        # Counter tallies in C and most_common is a heapq partial sort
+        themes = Counter(t for o in obs[-50:] for t in o.get('themes', ()))
         if themes:
             summary.append(f"\nRecent themes (last 50 observations):")
-            for t, c in sorted(themes.items(), key=lambda x: -x[1])[:5]:
-                summary.append(f"  - {t}: {c}")
+            for t, c in nlargest(5, themes.items(), key=itemgetter(1)):
+                summary.append(_THEME_FMT(t, c))
 
     return "\n".join(summary) if summary else "No significant memory context."
 
@@ -118,11 +207,9 @@ if __name__ == "__main__":
     print("=" * 60)
     print(get_memory_summary())
 
-    prompts = convene_council(question)
-
-    # Save prompts for easy copy/paste
-    output_file = Path(__file__).parent / "council_prompts.json"
-    with open(output_file, 'w') as f:
-        json.dump(prompts, f, indent=2)
+    # Stream prompts straight to disk for easy copy/paste — one JSON
+    # object per line, never more than one prompt in memory
+    output_file = Path(__file__).parent / "council_prompts.jsonl"
+    convene_council(question, output_file=output_file)
     print(f"\nPrompts saved to: {output_file}")
     print("\nCopy each prompt into Claude/GPT to get perspectives.")
@@ -10,8 +10,19 @@ Open: http://localhost:5010
 """
 
 import os
+import re
+import time
+import gzip
+import asyncio
+import hashlib
+import queue
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from flask import Flask, render_template_string, jsonify, request
+from functools import lru_cache, partial, wraps
+from flask import Flask, Response, jsonify, request
+from markupsafe import escape
 
 try:
     from google_tasks import get_all_tasks_by_category, create_task
@@ -26,13 +37,30 @@ except Exception:
     MEMORY_AVAILABLE = False
 
 try:
-    from google_calendar import get_todays_events, get_upcoming_events
+    from google_calendar import get_today_and_upcoming_events
     CALENDAR_AVAILABLE = True
 except Exception:
     CALENDAR_AVAILABLE = False
 
 app = Flask(__name__)
 
+# orjson-backed jsonify — the task/calendar payloads are deeply nested
+# and stdlib json is the slow path; fall back silently if not installed
+try:
+    import orjson
+    from flask.json.provider import JSONProvider
+
+    class ORJSONProvider(JSONProvider):
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = ORJSONProvider(app)
+except ImportError:
+    pass
+
 DASHBOARD_HTML = """
 <!DOCTYPE html>
 <html lang="en">
@@ -761,74 +789,29 @@ function setDate() {
     now.toLocaleDateString('en-US', { weekday: 'long', month: 'long', day: 'numeric' });
 }
 
-function renderGroups(groups, indent) {
-  let html = '';
-  const pad = indent ? 'task-row-indent' : '';
-  for (const g of groups) {
-    if (g.type === 'group') {
-      html += `<div class="subgroup"><div class="subgroup-label">${g.name}</div>`;
-      for (const t of g.tasks) {
-        const dueClass = t.due_today ? 'due-today' : t.due_soon ? 'due-soon' : '';
-        const due = t.due_display ? `<span class="task-due ${dueClass}">${t.due_display}</span>` : '';
-        html += `<div class="task-row task-row-indent"><div class="task-dot"></div><div class="task-text">${t.title}</div>${due}</div>`;
-      }
-      html += '</div>';
-    } else {
-      const dueClass = g.due_today ? 'due-today' : g.due_soon ? 'due-soon' : '';
-      const due = g.due_display ? `<span class="task-due ${dueClass}">${g.due_display}</span>` : '';
-      html += `<div class="task-row ${pad}"><div class="task-dot"></div><div class="task-text">${g.title}</div>${due}</div>`;
-    }
-  }
-  return html;
-}
-
-async function loadTasks() {
+function renderTasks(data) {
   try {
-    const res = await fetch('/api/tasks');
-    const data = await res.json();
-    const lists = data.lists || [];
-
-    // Split My Tasks from project lists
-    const myTasksList = lists.find(l => l.name === 'My Tasks');
-    const projectLists = lists.filter(l => l.name !== 'My Tasks');
-
-    // Count My Tasks only for stat
-    const myCount = myTasksList ? myTasksList.groups.reduce((n, g) => n + (g.type === 'group' ? g.tasks.length : 1), 0) : 0;
-    document.getElementById('stat-tasks').textContent = myCount;
+    // The fragment arrives pre-rendered and pre-escaped from the server —
+    // one innerHTML set, no client-side templating of user strings
+    document.getElementById('stat-tasks').textContent = data.my_count || 0;
     document.getElementById('stat-total').textContent = data.total || 0;
     document.getElementById('task-count').textContent = data.total || 0;
 
     const container = document.getElementById('tasks-container');
-    if (!lists.length) { container.innerHTML = '<div class="empty">No open tasks</div>'; return; }
-
-    let html = '';
-
-    // My Tasks — prominent, no list header
-    if (myTasksList) {
-      html += renderGroups(myTasksList.groups, false);
-    }
-
-    // Project lists — collapsible
-    if (projectLists.length) {
-      const totalProject = projectLists.reduce((n, l) => n + l.groups.reduce((m, g) => m + (g.type === 'group' ? g.tasks.length : 1), 0), 0);
-      html += `<div class="projects-toggle" onclick="toggleProjects(this)">
-        <span class="projects-toggle-label">Projects &amp; Context <span style="color:#333;font-weight:400">(${totalProject})</span></span>
-        <span class="projects-toggle-arrow">▾</span>
-      </div>
-      <div class="projects-body" id="projects-body">`;
-      for (const list of projectLists) {
-        html += `<div class="projects-list-label">${list.name}</div>`;
-        html += renderGroups(list.groups, false);
-      }
-      html += '</div>';
-    }
-
-    container.innerHTML = html;
+    if (data.error) { container.innerHTML = '<div class="empty">Could not load tasks</div>'; return; }
+    container.innerHTML = data.html || '<div class="empty">No open tasks</div>';
   } catch(e) {
     document.getElementById('tasks-container').innerHTML = '<div class="empty">Could not load tasks</div>';
   }
 }
 
+async function loadTasks() {
+  try {
+    const res = await fetch('/api/tasks');
+    renderTasks(await res.json());
+  } catch(e) { renderTasks(null); }
+}
+
 function toggleProjects(el) {
   const body = document.getElementById('projects-body');
   const arrow = el.querySelector('.projects-toggle-arrow');
@@ -836,10 +819,21 @@ function toggleProjects(el) {
   arrow.classList.toggle('open');
 }
 
-async function loadMeetings() {
+function el(tag, cls, text) {
+  const n = document.createElement(tag);
+  if (cls) n.className = cls;
+  if (text !== undefined) n.textContent = text;
+  return n;
+}
+
+function escHtml(s) {
+  const d = document.createElement('div');
+  d.textContent = s;
+  return d.innerHTML;
+}
+
+function renderMeetings(data) {
   try {
-    const res = await fetch('/api/calendar');
-    const data = await res.json();
     const days = data.days || [];
     const todayCount = data.today_count || 0;
     document.getElementById('stat-meetings').textContent = todayCount;
@@ -848,87 +842,124 @@ async function loadMeetings() {
     const container = document.getElementById('meetings-container');
     if (!days.length) { container.innerHTML = '<div class="empty">No meetings</div>'; return; }
 
-    let html = '';
+    // Build into a DocumentFragment with textContent for user strings —
+    // titles/attendees never go through an HTML parse, and the swap is
+    // one reflow inside requestAnimationFrame
+    const frag = document.createDocumentFragment();
     for (const day of days) {
       const isToday = day.label === 'Today';
-      html += `<div class="cal-day-header ${isToday ? 'today' : 'future'}">${day.label}</div>`;
+      frag.appendChild(el('div', `cal-day-header ${isToday ? 'today' : 'future'}`, day.label));
       if (!day.events.length) {
-        html += `<div class="cal-event allday"><div class="cal-time"></div><div class="cal-dot"></div><div class="cal-body"><div class="cal-title" style="color:#333">No meetings</div></div></div>`;
+        const ev = el('div', 'cal-event allday');
+        ev.appendChild(el('div', 'cal-time'));
+        ev.appendChild(el('div', 'cal-dot'));
+        const body = el('div', 'cal-body');
+        const t = el('div', 'cal-title', 'No meetings');
+        t.style.color = '#333';
+        body.appendChild(t);
+        ev.appendChild(body);
+        frag.appendChild(ev);
         continue;
       }
       for (const e of day.events) {
         const status = e.status || 'upcoming';
-        const timeLabel = e.time === 'All day' ? 'All day' : e.time;
         const attendees = (e.attendees_display || []).slice(0, 3).join(', ');
         const metaStr = attendees || (e.end_time ? `Until ${e.end_time}` : '');
-        const nowPip = status === 'now' ? ' 🟢' : '';
-        const prepAttendees = encodeURIComponent(JSON.stringify(e.attendees_display || []));
-        const prepTitle = encodeURIComponent(e.title);
-        const prepBtn = `<button class="prep-btn" onclick="openPrepPanel(event,'${prepTitle}','${prepAttendees}','${encodeURIComponent(e.time||'')}')">Prep ▶</button>`;
-        const inner = `<div class="cal-time">${timeLabel}</div>
-          <div class="cal-dot"></div>
-          <div class="cal-body">
-            <div class="cal-title">${e.title}${nowPip}</div>
-            ${metaStr ? `<div class="cal-meta">${metaStr}</div>` : ''}
-          </div>
-          ${status !== 'past' ? prepBtn : ''}`;
+
+        const inner = [];
+        inner.push(el('div', 'cal-time', e.time === 'All day' ? 'All day' : e.time));
+        inner.push(el('div', 'cal-dot'));
+        const body = el('div', 'cal-body');
+        body.appendChild(el('div', 'cal-title', e.title + (status === 'now' ? ' 🟢' : '')));
+        if (metaStr) body.appendChild(el('div', 'cal-meta', metaStr));
+        inner.push(body);
+        if (status !== 'past') {
+          const btn = el('button', 'prep-btn', 'Prep ▶');
+          btn.addEventListener('click',
+            (evt) => openPrepPanel(evt, e.title, e.attendees_display || [], e.time || ''));
+          inner.push(btn);
+        }
+
+        const row = el('div', `cal-event ${status}`);
         if (e.link) {
-          html += `<div class="cal-event ${status}"><a class="cal-link" href="${e.link}" target="_blank" style="display:contents">${inner}</a></div>`;
+          const a = el('a', 'cal-link');
+          a.href = e.link;
+          a.target = '_blank';
+          a.style.display = 'contents';
+          for (const n of inner) a.appendChild(n);
+          row.appendChild(a);
         } else {
-          html += `<div class="cal-event ${status}">${inner}</div>`;
+          for (const n of inner) row.appendChild(n);
         }
+        frag.appendChild(row);
       }
     }
-    container.innerHTML = html;
+    requestAnimationFrame(() => container.replaceChildren(frag));
   } catch(e) {
     document.getElementById('meetings-container').innerHTML = '<div class="empty">Could not load calendar</div>';
   }
 }
 
-async function loadAnchorTasks() {
+async function loadMeetings() {
+  try {
+    const res = await fetch('/api/calendar');
+    renderMeetings(await res.json());
+  } catch(e) { renderMeetings(null); }
+}
+
+function renderAnchorTasks(data) {
   try {
-    const res = await fetch('/api/anchor-tasks');
-    const data = await res.json();
     const tasks = data.tasks || [];
     const container = document.getElementById('anchor-tasks-container');
     if (!tasks.length) { container.innerHTML = '<div class="empty">All clear</div>'; return; }
 
     const labels = { in_progress: 'Active', pending: 'Pending', blocked: 'Blocked' };
-    let html = '';
+    const frag = document.createDocumentFragment();
     for (const t of tasks) {
-      const label = labels[t.status] || t.status;
-      html += `<div class="helm-task-row">
-        <span class="helm-badge badge-${t.status}">${label}</span>
-        <span class="helm-task-text">${t.title}</span>
-      </div>`;
+      const row = el('div', 'helm-task-row');
+      row.appendChild(el('span', `helm-badge badge-${t.status}`, labels[t.status] || t.status));
+      row.appendChild(el('span', 'helm-task-text', t.title));
+      frag.appendChild(row);
     }
-    container.innerHTML = html;
+    requestAnimationFrame(() => container.replaceChildren(frag));
   } catch(e) {
     document.getElementById('anchor-tasks-container').innerHTML = '<div class="empty">Could not load</div>';
   }
 }
 
-async function loadDecisions() {
+async function loadAnchorTasks() {
+  try {
+    const res = await fetch('/api/anchor-tasks');
+    renderAnchorTasks(await res.json());
+  } catch(e) { renderAnchorTasks(null); }
+}
+
+function renderDecisions(data) {
   try {
-    const res = await fetch('/api/decisions');
-    const data = await res.json();
     const decisions = data.decisions || [];
     const container = document.getElementById('decisions-container');
     if (!decisions.length) { container.innerHTML = '<div class="empty">No recent decisions</div>'; return; }
 
-    let html = '';
+    const frag = document.createDocumentFragment();
     for (const d of decisions.slice(0, 8)) {
-      html += `<div class="decision-row">
-        <div class="decision-text">${d.decision}</div>
-        <div class="decision-source">${d.from}</div>
-      </div>`;
+      const row = el('div', 'decision-row');
+      row.appendChild(el('div', 'decision-text', d.decision));
+      row.appendChild(el('div', 'decision-source', d.from));
+      frag.appendChild(row);
     }
-    container.innerHTML = html;
+    requestAnimationFrame(() => container.replaceChildren(frag));
   } catch(e) {
     document.getElementById('decisions-container').innerHTML = '<div class="empty">No data</div>';
   }
 }
 
+async function loadDecisions() {
+  try {
+    const res = await fetch('/api/decisions');
+    renderDecisions(await res.json());
+  } catch(e) { renderDecisions(null); }
+}
+
 async function submitCapture() {
   const input = document.getElementById('capture-input');
   const text = input.value.trim();
@@ -944,7 +975,8 @@ async function submitCapture() {
       const label = data.title && data.title !== text ? `→ "${data.title}"` : '';
       showToast('Added to Google Tasks ✓ ' + label);
       input.value = '';
-      setTimeout(loadTasks, 800);
+      lastCaptureTitle = data.title || text;
+      addTaskRowOptimistic(lastCaptureTitle);
     } else {
       showToast('Failed to add task');
     }
@@ -953,44 +985,93 @@ async function submitCapture() {
   }
 }
 
+function addTaskRowOptimistic(title) {
+  // Splice the new task straight into the DOM — no 800ms wait and no
+  // full /api/tasks refetch for one new row
+  const container = document.getElementById('tasks-container');
+  const row = document.createElement('div');
+  row.className = 'task-row';
+  row.innerHTML = '<div class="task-dot"></div><div class="task-text"></div>';
+  row.querySelector('.task-text').textContent = title;
+  const empty = container.querySelector('.empty');
+  if (empty) empty.remove();
+  container.prepend(row);
+  for (const id of ['stat-tasks', 'stat-total', 'task-count']) {
+    const el = document.getElementById(id);
+    el.textContent = (parseInt(el.textContent) || 0) + 1;
+  }
+}
+
 document.addEventListener('DOMContentLoaded', () => {
   document.getElementById('capture-input').addEventListener('keydown', (e) => {
     if (e.key === 'Enter' && !e.shiftKey) { e.preventDefault(); submitCapture(); }
   });
 });
 
-function openPrepPanel(evt, titleEnc, attendeesEnc, timeEnc) {
+// Push channel: captures from other tabs patch this view without any
+// polling. lastCaptureTitle suppresses the echo of our own capture.
+let lastCaptureTitle = null;
+try {
+  const stream = new EventSource('/api/stream');
+  stream.addEventListener('task-added', (e) => {
+    const data = JSON.parse(e.data);
+    if (data.title && data.title !== lastCaptureTitle) addTaskRowOptimistic(data.title);
+    lastCaptureTitle = null;
+  });
+} catch(e) {}
+
+function openPrepPanel(evt, title, attendees, time) {
   evt.preventDefault(); evt.stopPropagation();
-  const title = decodeURIComponent(titleEnc);
-  const attendees = JSON.parse(decodeURIComponent(attendeesEnc));
-  const time = decodeURIComponent(timeEnc);
   document.getElementById('prep-panel-title').textContent = title;
   document.getElementById('prep-panel-sub').textContent = attendees.length ? attendees.join(', ') : time;
   document.getElementById('prep-panel-body').innerHTML = '<div class="prep-loading"><span class="prep-loading-dot">●</span> Building your brief...</div>';
   document.getElementById('prep-panel').classList.add('open');
   document.getElementById('prep-overlay').classList.add('open');
 
+  // The server streams the brief as SSE frames — render each delta so
+  // the panel fills token by token instead of sitting on a spinner
   fetch('/api/meeting-prep', {
     method: 'POST',
     headers: {'Content-Type': 'application/json'},
     body: JSON.stringify({title, attendees, time})
   })
-  .then(r => r.json())
-  .then(data => {
+  .then(async res => {
     const body = document.getElementById('prep-panel-body');
-    let html = '';
-    if (data.brief) {
-      html += `<div class="prep-section"><div class="prep-section-label">Brief</div><div class="prep-brief">${data.brief}</div></div>`;
-    }
-    if (data.tasks && data.tasks.length) {
-      html += `<div class="prep-section"><div class="prep-section-label">Open Items (${data.tasks.length})</div>`;
-      for (const t of data.tasks) {
-        html += `<div class="prep-task-item"><span class="prep-task-dot">◦</span><span>${t}</span></div>`;
+    const reader = res.body.getReader();
+    const decoder = new TextDecoder();
+    let buf = '', brief = '', tasks = [];
+
+    const render = () => {
+      let html = '';
+      if (brief) {
+        html += `<div class="prep-section"><div class="prep-section-label">Brief</div><div class="prep-brief">${escHtml(brief)}</div></div>`;
+      }
+      if (tasks.length) {
+        html += `<div class="prep-section"><div class="prep-section-label">Open Items (${tasks.length})</div>`;
+        for (const t of tasks) {
+          html += `<div class="prep-task-item"><span class="prep-task-dot">◦</span><span>${escHtml(t)}</span></div>`;
+        }
+        html += '</div>';
+      }
+      if (!html) html = '<div class="prep-loading">No context found yet — add meeting notes via Quick Capture to build history.</div>';
+      body.innerHTML = html;
+    };
+
+    while (true) {
+      const {done, value} = await reader.read();
+      if (done) break;
+      buf += decoder.decode(value, {stream: true});
+      const frames = buf.split('\\n\\n');
+      buf = frames.pop();
+      for (const frame of frames) {
+        if (!frame.startsWith('data: ')) continue;
+        const data = JSON.parse(frame.slice(6));
+        if (data.error) throw new Error(data.error);
+        if (data.tasks) tasks = data.tasks;
+        if (data.delta) brief += data.delta;
       }
-      html += '</div>';
+      render();
     }
-    if (!html) html = '<div class="prep-loading">No context found yet — add meeting notes via Quick Capture to build history.</div>';
-    body.innerHTML = html;
   })
   .catch(() => {
     document.getElementById('prep-panel-body').innerHTML = '<div class="prep-loading">Could not generate brief.</div>';
@@ -1002,10 +1083,8 @@ function closePrepPanel() {
   document.getElementById('prep-overlay').classList.remove('open');
 }
 
-async function loadWeather() {
+function renderWeather(data) {
   try {
-    const res = await fetch('/api/weather');
-    const data = await res.json();
     if (data.error) { document.getElementById('weather-container').innerHTML = '<div class="empty">Unavailable</div>'; return; }
 
     const now = new Date();
@@ -1037,7 +1116,43 @@ async function loadWeather() {
   }
 }
 
-function loadAll() { setDate(); loadTasks(); loadMeetings(); loadDecisions(); loadAnchorTasks(); loadWeather(); }
+async function loadWeather() {
+  try {
+    const res = await fetch('/api/weather');
+    renderWeather(await res.json());
+  } catch(e) { renderWeather(null); }
+}
+
+async function loadAll() {
+  setDate();
+  // Critical panels (tasks + meetings) paint first; the side column
+  // loads when the browser is idle so weather can't delay first render
+  try {
+    const res = await fetch('/api/bootstrap?only=main');
+    if (!res.ok) throw new Error(res.status);
+    const data = await res.json();
+    renderTasks(data.tasks);
+    renderMeetings(data.calendar);
+  } catch(e) {
+    await Promise.all([loadTasks(), loadMeetings()]);
+  }
+
+  const idle = window.requestIdleCallback
+    ? (fn) => requestIdleCallback(fn, {timeout: 1500})
+    : (fn) => setTimeout(fn, 200);
+  idle(async () => {
+    try {
+      const res = await fetch('/api/bootstrap?only=side');
+      if (!res.ok) throw new Error(res.status);
+      const data = await res.json();
+      renderDecisions(data.decisions);
+      renderAnchorTasks(data.anchor_tasks);
+      renderWeather(data.weather);
+    } catch(e) {
+      loadDecisions(); loadAnchorTasks(); loadWeather();
+    }
+  });
+}
 loadAll();
 </script>
 </body>
@@ -1045,11 +1160,76 @@ loadAll();
 """
 
 
-@app.route('/')
-def index():
-    return render_template_string(DASHBOARD_HTML)
+# Split the big stylesheet out of the page at import: the HTML keeps a
+# tiny critical block (shell + layout) and links an immutable
+# fingerprinted CSS URL the browser caches for a year. Styles still live
+# in the single DASHBOARD_HTML source above.
+_CRITICAL_CSS = (
+    "* { box-sizing: border-box; margin: 0; padding: 0; }"
+    "body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;"
+    " background: #0f0f13; color: #e2e2e8; min-height: 100vh; }"
+    ".header { background: #18181f; border-bottom: 1px solid #2a2a35; padding: 14px 28px;"
+    " display: flex; align-items: center; justify-content: space-between;"
+    " position: sticky; top: 0; z-index: 100; }"
+    ".layout { display: grid; grid-template-columns: 1fr 360px; gap: 20px;"
+    " padding: 20px 28px; max-width: 1300px; margin: 0 auto; }"
+)
+
+_style_start = DASHBOARD_HTML.index('<style>')
+_style_end = DASHBOARD_HTML.index('</style>')
+HELM_CSS = DASHBOARD_HTML[_style_start + len('<style>'):_style_end]
+_CSS_BYTES = HELM_CSS.encode('utf-8')
+_CSS_ETAG = hashlib.sha1(_CSS_BYTES).hexdigest()[:10]
+
+# Encode the page once at import and serve the bytes directly instead of
+# re-parsing ~600 lines per request. Compressed variants are precomputed
+# too, so each page load costs a header check rather than a compression
+# pass.
+_DASHBOARD_BYTES = (
+    DASHBOARD_HTML[:_style_start]
+    + f'<style>{_CRITICAL_CSS}</style>'
+    + f'<link rel="stylesheet" href="/assets/helm-{_CSS_ETAG}.css">'
+    + DASHBOARD_HTML[_style_end + len('</style>'):]
+).encode('utf-8')
+_DASHBOARD_GZ = gzip.compress(_DASHBOARD_BYTES, 9)
+try:
+    import brotli
+    _DASHBOARD_BR = brotli.compress(_DASHBOARD_BYTES, quality=11)
+except ImportError:
+    _DASHBOARD_BR = None
 
 
+@app.route('/')
+def index():
+    accept = request.headers.get('Accept-Encoding', '')
+    body, encoding = _DASHBOARD_BYTES, None
+    if _DASHBOARD_BR is not None and 'br' in accept:
+        body, encoding = _DASHBOARD_BR, 'br'
+    elif 'gzip' in accept:
+        body, encoding = _DASHBOARD_GZ, 'gzip'
+
+    headers = {'Cache-Control': 'public, max-age=300', 'Vary': 'Accept-Encoding'}
+    if encoding:
+        headers['Content-Encoding'] = encoding
+    return Response(body, mimetype='text/html', headers=headers)
+
+
+@app.route('/assets/helm-<fingerprint>.css')
+def helm_css(fingerprint):
+    # Fingerprint is baked into the URL, so the content never changes
+    # for a given path — cache it hard
+    return Response(
+        _CSS_BYTES,
+        mimetype='text/css',
+        headers={'Cache-Control': 'public, max-age=31536000, immutable',
+                 'ETag': _CSS_ETAG},
+    )
+
+
+# Due strings repeat heavily across tasks and refreshes; cache the
+# parse+format keyed on (string, today) so each combination is computed
+# once per day
+@lru_cache(maxsize=4096)
 def _format_due(due_str, today):
     if not due_str:
         return '', False, False
@@ -1078,19 +1258,151 @@ def _format_task_for_display(t, today):
     }
 
 
-@app.route('/api/tasks')
-def api_tasks():
+def _render_task_row(t, indent=False):
+    """One escaped task-row fragment (title is user-controlled)."""
+    due_class = 'due-today' if t['due_today'] else ('due-soon' if t['due_soon'] else '')
+    due = (f'<span class="task-due {due_class}">{escape(t["due_display"])}</span>'
+           if t['due_display'] else '')
+    pad = ' task-row-indent' if indent else ''
+    return (f'<div class="task-row{pad}"><div class="task-dot"></div>'
+            f'<div class="task-text">{escape(t["title"])}</div>{due}</div>')
+
+
+def _render_groups(groups):
+    """Escaped HTML for a list's groups — rendered once server-side."""
+    parts = []
+    for g in groups:
+        if g['type'] == 'group':
+            parts.append(f'<div class="subgroup"><div class="subgroup-label">{escape(g["name"])}</div>')
+            parts.extend(_render_task_row(t, indent=True) for t in g['tasks'])
+            parts.append('</div>')
+        else:
+            parts.append(_render_task_row(g))
+    return ''.join(parts)
+
+
+def _group_count(groups):
+    return sum(len(g['tasks']) if g['type'] == 'group' else 1 for g in groups)
+
+
+def _render_tasks_html(result_lists):
+    """Build the whole tasks panel fragment, escaped exactly once."""
+    if not result_lists:
+        return '', 0
+    my_list = next((l for l in result_lists if l['name'] == 'My Tasks'), None)
+    project_lists = [l for l in result_lists if l['name'] != 'My Tasks']
+
+    parts = []
+    my_count = 0
+    if my_list:
+        my_count = _group_count(my_list['groups'])
+        parts.append(_render_groups(my_list['groups']))
+
+    if project_lists:
+        total_project = sum(_group_count(l['groups']) for l in project_lists)
+        parts.append(
+            '<div class="projects-toggle" onclick="toggleProjects(this)">'
+            '<span class="projects-toggle-label">Projects &amp; Context '
+            f'<span style="color:#333;font-weight:400">({total_project})</span></span>'
+            '<span class="projects-toggle-arrow">▾</span></div>'
+            '<div class="projects-body" id="projects-body">')
+        for plist in project_lists:
+            parts.append(f'<div class="projects-list-label">{escape(plist["name"])}</div>')
+            parts.append(_render_groups(plist['groups']))
+        parts.append('</div>')
+
+    return ''.join(parts), my_count
+
+
+# Per-payload TTL cache — F5 spam and multi-tab loads within the window
+# are served from memory instead of re-hitting Google. Weather keeps its
+# own longer-lived cache below.
+_PAYLOAD_TTLS = {'tasks': 30, 'calendar': 60, 'decisions': 120, 'anchor': 30,
+                 'task_index': 30}
+_payload_cache = {}
+_payload_locks = {}
+_payload_locks_guard = threading.Lock()
+
+
+# One shared worker pool for payload building. Flask async views spin
+# up a fresh event loop per request, so asyncio.to_thread would lean on
+# a per-loop default executor; a module-level pool keeps threads warm
+# and caps concurrency in one place. Sized generously — the work is
+# I/O-dominated.
+_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix='helm')
+
+
+async def _offload(fn, *args):
+    """Run blocking payload work on the shared pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_EXECUTOR, partial(fn, *args))
+
+
+def etagged(view):
+    """Give a GET view an ETag + short private cache so unchanged
+    payloads answer 304 instead of re-sending the JSON."""
+    @wraps(view)
+    async def wrapper(*args, **kwargs):
+        resp = await view(*args, **kwargs)
+        etag = hashlib.blake2b(resp.get_data(), digest_size=8).hexdigest()
+        if request.headers.get('If-None-Match') == etag:
+            return '', 304
+        resp.headers['ETag'] = etag
+        resp.headers['Cache-Control'] = 'private, max-age=30, must-revalidate'
+        return resp
+    return wrapper
+
+
+def _cached_payload(key, builder):
+    """Run builder through the TTL cache for key (errors aren't cached).
+
+    Single-flight: concurrent misses for the same key (refresh spam,
+    multiple tabs) queue on a per-key lock and reuse the first caller's
+    result instead of dispatching duplicate Google call chains. Entries
+    age on time.monotonic() so a wall-clock step can't flush or wedge
+    the cache.
+    """
+    entry = _payload_cache.get(key)
+    if entry and time.monotonic() - entry[0] < _PAYLOAD_TTLS.get(key, 30):
+        return entry[1]
+
+    with _payload_locks_guard:
+        lock = _payload_locks.setdefault(key, threading.Lock())
+
+    with lock:
+        # Re-check under the lock — the request we queued behind may
+        # have just filled the cache
+        entry = _payload_cache.get(key)
+        if entry and time.monotonic() - entry[0] < _PAYLOAD_TTLS.get(key, 30):
+            return entry[1]
+        value = builder()
+        if not (isinstance(value, dict) and value.get('error')):
+            _payload_cache[key] = (time.monotonic(), value)
+        return value
+
+
+# The cached google_tasks service rides a single httplib2 transport,
+# which is not safe for concurrent execute(); the per-key cache locks
+# don't serialize across keys (a prep click plus an F5 is two threads),
+# so every call through that service funnels through this lock.
+_gtasks_service_lock = threading.Lock()
+
+
+def _fetch_all_tasks():
+    from google_tasks import get_all_tasks_hierarchical
+    with _gtasks_service_lock:
+        return get_all_tasks_hierarchical()
+
+
+def _tasks_payload():
     if not TASKS_AVAILABLE:
-        return jsonify({'lists': [], 'total': 0})
+        return {'lists': [], 'total': 0}
     try:
-        from google_tasks import get_task_lists, get_tasks_hierarchical
-        task_lists = get_task_lists()
         today = datetime.now().date()
         total = 0
         result_lists = []
 
-        for tl in task_lists:
-            raw_cats = get_tasks_hierarchical(tl['id'])
+        for tl, raw_cats in _fetch_all_tasks():
             groups = []
 
             for cat in raw_cats:
@@ -1111,15 +1423,37 @@ def api_tasks():
             if groups:
                 result_lists.append({'name': tl['title'], 'groups': groups})
 
-        return jsonify({'lists': result_lists, 'total': total})
+        html, my_count = _render_tasks_html(result_lists)
+        # The client renders only the html fragment + counters — shipping
+        # result_lists too roughly doubled the payload for nothing
+        return {'total': total, 'html': html, 'my_count': my_count}
     except Exception as e:
-        return jsonify({'error': str(e), 'lists': [], 'total': 0})
+        return {'error': str(e), 'lists': [], 'total': 0}
 
 
-@app.route('/api/calendar')
-def api_calendar():
+@app.route('/api/tasks')
+@etagged
+async def api_tasks():
+    return jsonify(await _offload(_cached_payload, 'tasks', _tasks_payload))
+
+
+@lru_cache(maxsize=512)
+def _parse_iso(s):
+    """ISO timestamps repeat across events and refreshes — parse once."""
+    return datetime.fromisoformat(s)
+
+
+@lru_cache(maxsize=64)
+def _day_label(date_key):
+    try:
+        return _parse_iso(date_key).strftime('%A, %b %-d')
+    except Exception:
+        return date_key
+
+
+def _calendar_payload():
     if not CALENDAR_AVAILABLE:
-        return jsonify({'days': [], 'today_count': 0})
+        return {'days': [], 'today_count': 0}
     try:
         from datetime import timezone
         now = datetime.now().astimezone()
@@ -1138,9 +1472,11 @@ def api_calendar():
             # Empty color_id = calendar default (blue) = keep
             return str(e.get('color_id', '')) not in SKIP_COLOR_IDS
 
-        # Today's full day (including past events) + next 4 days upcoming
-        today_events = [e for e in get_todays_events() if is_real_meeting(e)]
-        upcoming = [e for e in get_upcoming_events(days=5) if is_real_meeting(e)]
+        # Today's full day (including past events) + next 4 days upcoming,
+        # fetched in one batched round trip
+        today_raw, upcoming_raw = get_today_and_upcoming_events(days=5)
+        today_events = [e for e in today_raw if is_real_meeting(e)]
+        upcoming = [e for e in upcoming_raw if is_real_meeting(e)]
 
         # Merge: today_events covers all of today; upcoming covers from now
         # Use today_events for today, upcoming for future days
@@ -1153,8 +1489,8 @@ def api_calendar():
                 e['status'] = 'allday'
                 return e
             try:
-                start_dt = datetime.fromisoformat(e['start_iso'])
-                end_dt = datetime.fromisoformat(e['end_iso']) if e.get('end_iso') else start_dt
+                start_dt = _parse_iso(e['start_iso'])
+                end_dt = _parse_iso(e['end_iso']) if e.get('end_iso') else start_dt
                 if end_dt < now:
                     e['status'] = 'past'
                 elif start_dt <= now <= end_dt:
@@ -1175,101 +1511,198 @@ def api_calendar():
 
         days = [{'date': today_str, 'label': 'Today', 'events': today_events}]
         for date_key in sorted(future_by_date.keys())[:3]:
-            try:
-                label = datetime.fromisoformat(date_key).strftime('%A, %b %-d')
-            except Exception:
-                label = date_key
-            days.append({'date': date_key, 'label': label, 'events': future_by_date[date_key]})
+            days.append({'date': date_key, 'label': _day_label(date_key),
+                         'events': future_by_date[date_key]})
 
         today_count = len(today_events)
-        return jsonify({'days': days, 'today_count': today_count})
+        return {'days': days, 'today_count': today_count}
     except Exception as e:
-        return jsonify({'error': str(e), 'days': [], 'today_count': 0})
+        return {'error': str(e), 'days': [], 'today_count': 0}
 
 
-@app.route('/api/meetings')
-def api_meetings():
+@app.route('/api/calendar')
+@etagged
+async def api_calendar():
+    return jsonify(await _offload(_cached_payload, 'calendar', _calendar_payload))
+
+
+def _meetings_payload():
     if not MEMORY_AVAILABLE:
-        return jsonify({'meetings': []})
+        return {'meetings': []}
     try:
         mem = load_memory()
         meetings = list(reversed(mem.get('meetings', [])[-10:]))
-        return jsonify({'meetings': meetings})
+        return {'meetings': meetings}
     except Exception as e:
-        return jsonify({'error': str(e), 'meetings': []})
+        return {'error': str(e), 'meetings': []}
 
 
-@app.route('/api/decisions')
-def api_decisions():
-    if not MEMORY_AVAILABLE:
-        return jsonify({'decisions': []})
+@app.route('/api/meetings')
+@etagged
+async def api_meetings():
+    return jsonify(await _offload(_meetings_payload))
+
+
+# --- SQLite store for decisions + anchor tasks ------------------------
+# Re-parsing the memory JSON and CLAUDE.md on every request is wasted
+# work: both land in a small SQLite DB (with an FTS5 index over decision
+# text where the build supports it), refreshed only when the backing
+# file's mtime moves, and the endpoints become a SELECT.
+HELM_DB = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'helm.db')
+_db = sqlite3.connect(HELM_DB, check_same_thread=False)
+_db_lock = threading.Lock()
+_db.executescript("""
+    CREATE TABLE IF NOT EXISTS decisions (
+        seq INTEGER PRIMARY KEY,
+        decision TEXT,
+        source TEXT,
+        date TEXT
+    );
+    CREATE TABLE IF NOT EXISTS anchor_tasks (
+        seq INTEGER PRIMARY KEY,
+        title TEXT,
+        status TEXT
+    );
+    CREATE TABLE IF NOT EXISTS source_mtimes (
+        source TEXT PRIMARY KEY,
+        mtime REAL
+    );
+""")
+try:
+    _db.execute(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS decisions_fts USING fts5(decision)")
+    _DB_FTS = True
+except sqlite3.OperationalError:
+    _DB_FTS = False
+
+
+def _source_changed(name, path):
+    """True (and record the new mtime) when path moved since last refresh."""
     try:
+        mtime = os.stat(path).st_mtime
+    except OSError:
+        return False
+    row = _db.execute(
+        "SELECT mtime FROM source_mtimes WHERE source = ?", (name,)).fetchone()
+    if row and row[0] == mtime:
+        return False
+    _db.execute(
+        "INSERT OR REPLACE INTO source_mtimes (source, mtime) VALUES (?, ?)",
+        (name, mtime))
+    return True
+
+
+def _refresh_decisions():
+    from shared_memory import MEMORY_FILE
+    with _db_lock:
+        if not _source_changed('memory', MEMORY_FILE):
+            return
         mem = load_memory()
-        decisions = []
+        rows = []
         for m in reversed(mem.get('meetings', [])[-15:]):
             for d in m.get('signals', {}).get('decisions', []):
-                decisions.append({'decision': d, 'from': m.get('title', ''), 'date': m.get('date', '')})
-        return jsonify({'decisions': decisions[:10]})
+                rows.append((d, m.get('title', ''), m.get('date', '')))
+        _db.execute("DELETE FROM decisions")
+        _db.executemany(
+            "INSERT INTO decisions (decision, source, date) VALUES (?, ?, ?)", rows)
+        if _DB_FTS:
+            _db.execute("DELETE FROM decisions_fts")
+            _db.executemany(
+                "INSERT INTO decisions_fts (decision) VALUES (?)",
+                [(r[0],) for r in rows])
+        _db.commit()
+
+
+def _decisions_payload():
+    if not MEMORY_AVAILABLE:
+        return {'decisions': []}
+    try:
+        _refresh_decisions()
+        with _db_lock:
+            rows = _db.execute(
+                "SELECT decision, source, date FROM decisions ORDER BY seq LIMIT 10"
+            ).fetchall()
+        return {'decisions': [
+            {'decision': d, 'from': s, 'date': dt} for d, s, dt in rows]}
     except Exception as e:
-        return jsonify({'error': str(e), 'decisions': []})
+        return {'error': str(e), 'decisions': []}
+
+
+@app.route('/api/decisions')
+@etagged
+async def api_decisions():
+    return jsonify(await _offload(_cached_payload, 'decisions', _decisions_payload))
+
+
+# Anchor-task markers and the bold-title pattern, compiled once
+_ANCHOR_STATUS = {
+    '🔄': 'in_progress',
+    '[ ]': 'pending',
+    '🚧': 'blocked',
+}
+_BOLD_RE = re.compile(r'\*\*(.+?)\*\*')
 
 
 def parse_anchor_tasks():
     """Parse the running to-do list from ~/.claude/CLAUDE.md."""
     claude_md = os.path.expanduser('~/.claude/CLAUDE.md')
     items = []
-    STATUS = {
-        '🔄': 'in_progress',
-        '[ ]': 'pending',
-        '🚧': 'blocked',
-    }
     try:
+        # Stream the file line by line — no whole-file read + split
         with open(claude_md) as f:
-            content = f.read()
-        in_todo = False
-        for line in content.split('\n'):
-            if '## Running To-Do List' in line:
-                in_todo = True
-                continue
-            if in_todo and line.startswith('## '):
-                break
-            if not in_todo:
-                continue
-            stripped = line.strip()
-            for marker, status in STATUS.items():
-                if stripped.startswith(f'- {marker}'):
-                    text = stripped[len(f'- {marker}'):].strip()
-                    # Pull bold title if present
-                    import re
-                    m = re.match(r'\*\*(.+?)\*\*', text)
-                    title = m.group(1) if m else text.split('—')[0].strip()
-                    items.append({'title': title, 'status': status})
+            in_todo = False
+            for line in f:
+                if '## Running To-Do List' in line:
+                    in_todo = True
+                    continue
+                if in_todo and line.startswith('## '):
                     break
+                if not in_todo:
+                    continue
+                stripped = line.strip()
+                for marker, status in _ANCHOR_STATUS.items():
+                    if stripped.startswith(f'- {marker}'):
+                        text = stripped[len(f'- {marker}'):].strip()
+                        # Pull bold title if present
+                        m = _BOLD_RE.match(text)
+                        title = m.group(1) if m else text.split('—')[0].strip()
+                        items.append({'title': title, 'status': status})
+                        break
     except Exception as e:
         print(f"Could not parse CLAUDE.md: {e}")
     return items
 
 
 @app.route('/api/anchor-tasks')
-def api_anchor_tasks():
-    return jsonify({'tasks': parse_anchor_tasks()})
+@etagged
+async def api_anchor_tasks():
+    return jsonify(await _offload(_cached_payload, 'anchor', _anchor_payload))
+
+
+# distill_to_task patterns, compiled once
+_URL_RE = re.compile(r'https?://[^\s\)\"\']+')
+_FENCE_RE = re.compile(r'^```json?\s*|\s*```$', re.MULTILINE)
 
 
 def distill_to_task(raw_text):
     """Use Claude to distill raw text (DMs, notes, blobs) into a clean action item title + notes."""
-    import re as _re
     if len(raw_text) < 80:
         return raw_text, None
 
+    # Already a clean one-liner with no URLs — skip the LLM round trip
+    if len(raw_text) < 100 and '\n' not in raw_text and not _URL_RE.search(raw_text):
+        return raw_text, None
+
     # Always extract URLs from raw text — they must survive regardless of Claude output
-    urls = _re.findall(r'https?://[^\s\)\"\']+', raw_text)
+    urls = _URL_RE.findall(raw_text)
 
     try:
         import anthropic, json as _json
         client = anthropic.Anthropic()
         response = client.messages.create(
             model='claude-haiku-4-5-20251001',
-            max_tokens=300,
+            # a title + one-sentence note never needs more than this
+            max_tokens=150,
             messages=[{
                 'role': 'user',
                 'content': (
@@ -1281,7 +1714,7 @@ def distill_to_task(raw_text):
             }]
         )
         raw_response = response.content[0].text.strip()
-        raw_response = _re.sub(r'^```json?\s*|\s*```$', '', raw_response, flags=_re.MULTILINE).strip()
+        raw_response = _FENCE_RE.sub('', raw_response).strip()
         data = _json.loads(raw_response)
         title = data.get('title', '').strip()
         notes = data.get('notes', '').strip() or None
@@ -1301,115 +1734,218 @@ def distill_to_task(raw_text):
     return first_line or raw_text[:80], notes
 
 
+# --- SSE push channel -------------------------------------------------
+# Connected dashboards get change events (e.g. a capture from another
+# tab) pushed to them instead of re-running full endpoint chains.
+_stream_clients = []
+_stream_lock = threading.Lock()
+
+
+def _broadcast(event_type, payload):
+    """Queue an SSE event for every connected dashboard."""
+    import json as _json
+    frame = f'event: {event_type}\ndata: {_json.dumps(payload)}\n\n'
+    with _stream_lock:
+        clients = list(_stream_clients)
+    for client_q in clients:
+        try:
+            client_q.put_nowait(frame)
+        except queue.Full:
+            pass
+
+
+@app.route('/api/stream')
+def api_stream():
+    client_q = queue.Queue(maxsize=64)
+    with _stream_lock:
+        _stream_clients.append(client_q)
+
+    def gen():
+        try:
+            while True:
+                try:
+                    yield client_q.get(timeout=25)
+                except queue.Empty:
+                    yield ': keepalive\n\n'
+        finally:
+            with _stream_lock:
+                _stream_clients.remove(client_q)
+
+    return Response(
+        gen(),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+    )
+
+
 @app.route('/api/capture', methods=['POST'])
-def api_capture():
+async def api_capture():
     if not TASKS_AVAILABLE:
         return jsonify({'ok': False, 'error': 'Tasks not available'})
     try:
         text = request.json.get('text', '').strip()
         if not text:
             return jsonify({'ok': False})
-        title, notes = distill_to_task(text)
-        result = create_task(title, notes=notes)
-        return jsonify({'ok': bool(result), 'title': title, 'notes': notes})
+
+        def _capture():
+            title, notes = distill_to_task(text)
+            with _gtasks_service_lock:
+                result = create_task(title, notes=notes)
+            if result:
+                # Real change: drop the cached payload and notify other tabs
+                _payload_cache.pop('tasks', None)
+                _broadcast('task-added', {'title': title})
+            return {'ok': bool(result), 'title': title, 'notes': notes}
+
+        return jsonify(await _offload(_capture))
     except Exception as e:
         return jsonify({'ok': False, 'error': str(e)})
 
 
-@app.route('/api/meeting-prep', methods=['POST'])
-def api_meeting_prep():
-    try:
-        import anthropic, re as _re
-        body = request.json or {}
-        meeting_title = body.get('title', '')
-        attendees = body.get('attendees', [])  # list of display names
-        meeting_time = body.get('time', '')
-
-        # --- Pull relevant Google Tasks ---
-        relevant_tasks = []
-        if TASKS_AVAILABLE:
-            from google_tasks import get_task_lists, get_tasks_hierarchical
-            task_lists = get_task_lists()
-            keywords = set()
-            # Keywords from meeting title
-            for w in _re.split(r'[\s\-/]+', meeting_title.lower()):
-                if len(w) > 3:
-                    keywords.add(w)
-            # Keywords from attendee first names
-            for a in attendees:
-                first = a.split()[0].lower() if a else ''
-                if first:
-                    keywords.add(first)
-
-            for tl in task_lists:
-                for cat in get_tasks_hierarchical(tl['id']):
-                    title_lower = cat['name'].lower()
-                    notes_lower = ''
-                    # Check parent task
-                    if any(k in title_lower or k in notes_lower for k in keywords):
-                        relevant_tasks.append(cat['name'])
-                    # Check subtasks
-                    for t in cat.get('tasks', []):
-                        t_lower = t.get('title', '').lower()
-                        if any(k in t_lower for k in keywords):
-                            relevant_tasks.append(t.get('title', ''))
-
-        relevant_tasks = relevant_tasks[:12]
-
-        # --- Pull recent decisions from shared_memory ---
-        past_context = []
-        if MEMORY_AVAILABLE:
-            mem = load_memory()
-            keywords_list = list(keywords) if 'keywords' in dir() else []
-            for m in reversed(mem.get('meetings', [])[-30:]):
-                m_text = (m.get('title', '') + ' ' + str(m.get('signals', {}))).lower()
-                if any(k in m_text for k in keywords_list):
-                    for d in m.get('signals', {}).get('decisions', []):
-                        past_context.append(f"Decision ({m.get('date','')[:10]}): {d}")
-                    for a in m.get('signals', {}).get('actions_for_me', []):
-                        past_context.append(f"Action from meeting: {a}")
-            past_context = past_context[:8]
-
-        # --- Build Claude prompt ---
-        context_parts = []
-        if relevant_tasks:
-            context_parts.append("Open tasks related to this meeting:\n" + "\n".join(f"- {t}" for t in relevant_tasks))
-        if past_context:
-            context_parts.append("Past decisions/actions:\n" + "\n".join(f"- {c}" for c in past_context))
-
-        context_str = "\n\n".join(context_parts) if context_parts else "No prior context found yet."
-        attendees_str = ", ".join(attendees) if attendees else "unknown attendees"
-
-        prompt = (
-            f"You are helping Lucas Willett (Director, Customer Support at Visiting Media) prepare for a meeting.\n\n"
-            f"Meeting: {meeting_title}\n"
-            f"Attendees: {attendees_str}\n"
-            f"Time: {meeting_time}\n\n"
-            f"Context from support memory:\n{context_str}\n\n"
-            f"Write a concise meeting prep brief (4-8 sentences). Include:\n"
-            f"- What's open or unresolved that's relevant to this meeting\n"
-            f"- What Lucas should get from or communicate to the attendees\n"
-            f"- Any decisions or commitments to follow up on\n"
-            f"- One clear 'walk in knowing' statement\n\n"
-            f"If there's no specific context, give general prep advice for this meeting type.\n"
-            f"Be direct. No headers. No bullet points. Just a flowing prep paragraph."
-        )
+_TOKEN_RE = re.compile(r'\w+')
 
-        client = anthropic.Anthropic()
-        resp = client.messages.create(
-            model='claude-haiku-4-5-20251001',
-            max_tokens=400,
-            messages=[{'role': 'user', 'content': prompt}]
-        )
-        brief = resp.content[0].text.strip()
 
-        return jsonify({'brief': brief, 'tasks': relevant_tasks})
+def _build_task_index():
+    """Inverted index: lowercased title token -> task titles.
 
-    except Exception as e:
-        return jsonify({'error': str(e), 'brief': '', 'tasks': []})
+    Refreshed on the tasks TTL, so a prep click costs O(keywords) dict
+    lookups instead of scanning every task title.
+    """
+    index = {}
 
+    def add(title):
+        for tok in _TOKEN_RE.findall(title.lower()):
+            index.setdefault(tok, []).append(title)
 
-_weather_cache = {'data': None, 'ts': 0}
+    for tl, cats in _fetch_all_tasks():
+        for cat in cats:
+            add(cat['name'])
+            for t in cat.get('tasks', []):
+                add(t.get('title', ''))
+    return index
+
+
+def _meeting_prep_context(body):
+    """Gather tasks/decisions context and build the LLM prompt.
+
+    Returns (prompt, relevant_tasks).
+    """
+    import re as _re
+    meeting_title = body.get('title', '')
+    attendees = body.get('attendees', [])  # list of display names
+    meeting_time = body.get('time', '')
+
+    keywords = set()
+    # Keywords from meeting title
+    for w in _re.split(r'[\s\-/]+', meeting_title.lower()):
+        if len(w) > 3:
+            keywords.add(w)
+    # Keywords from attendee first names
+    for a in attendees:
+        first = a.split()[0].lower() if a else ''
+        if first:
+            keywords.add(first)
+
+    # One alternation regex instead of K substring scans per string
+    kw_re = _re.compile('|'.join(_re.escape(k) for k in keywords)) if keywords else None
+
+    # Kick the index build/refresh onto the shared pool so the memory
+    # scan below overlaps it instead of waiting behind it
+    index_future = None
+    if TASKS_AVAILABLE and keywords:
+        index_future = _EXECUTOR.submit(_cached_payload, 'task_index', _build_task_index)
+
+    # --- Pull recent decisions from shared_memory ---
+    past_context = []
+    if MEMORY_AVAILABLE and kw_re:
+        mem = load_memory()
+        for m in reversed(mem.get('meetings', [])[-30:]):
+            if len(past_context) >= 8:
+                break
+            m_text = (m.get('title', '') + ' ' + str(m.get('signals', {}))).lower()
+            if kw_re.search(m_text):
+                for d in m.get('signals', {}).get('decisions', []):
+                    past_context.append(f"Decision ({m.get('date','')[:10]}): {d}")
+                for a in m.get('signals', {}).get('actions_for_me', []):
+                    past_context.append(f"Action from meeting: {a}")
+        past_context = past_context[:8]
+
+    # --- Pull relevant Google Tasks via the inverted index ---
+    relevant_tasks = []
+    if index_future is not None:
+        index = index_future.result()
+        seen = set()
+        for k in keywords:
+            for title in index.get(k, ()):
+                if title not in seen:
+                    seen.add(title)
+                    relevant_tasks.append(title)
+
+    relevant_tasks = relevant_tasks[:12]
+
+    # --- Build Claude prompt ---
+    context_parts = []
+    if relevant_tasks:
+        context_parts.append("Open tasks related to this meeting:\n" + "\n".join(f"- {t}" for t in relevant_tasks))
+    if past_context:
+        context_parts.append("Past decisions/actions:\n" + "\n".join(f"- {c}" for c in past_context))
+
+    context_str = "\n\n".join(context_parts) if context_parts else "No prior context found yet."
+    attendees_str = ", ".join(attendees) if attendees else "unknown attendees"
+
+    prompt = (
+        f"You are helping Lucas Willett (Director, Customer Support at Visiting Media) prepare for a meeting.\n\n"
+        f"Meeting: {meeting_title}\n"
+        f"Attendees: {attendees_str}\n"
+        f"Time: {meeting_time}\n\n"
+        f"Context from support memory:\n{context_str}\n\n"
+        f"Write a concise meeting prep brief (4-8 sentences). Include:\n"
+        f"- What's open or unresolved that's relevant to this meeting\n"
+        f"- What Lucas should get from or communicate to the attendees\n"
+        f"- Any decisions or commitments to follow up on\n"
+        f"- One clear 'walk in knowing' statement\n\n"
+        f"If there's no specific context, give general prep advice for this meeting type.\n"
+        f"Be direct. No headers. No bullet points. Just a flowing prep paragraph."
+    )
+
+    return prompt, relevant_tasks
+
+
+@app.route('/api/meeting-prep', methods=['POST'])
+def api_meeting_prep():
+    """Stream the prep brief as SSE so the panel fills token by token
+    instead of blocking on the whole LLM generation."""
+    import json as _json
+    body = request.json or {}
+
+    def gen():
+        try:
+            import anthropic
+            prompt, relevant_tasks = _meeting_prep_context(body)
+            yield 'data: ' + _json.dumps({'tasks': relevant_tasks}) + '\n\n'
+
+            client = anthropic.Anthropic()
+            with client.messages.stream(
+                model='claude-haiku-4-5-20251001',
+                max_tokens=400,
+                messages=[{'role': 'user', 'content': prompt}]
+            ) as stream:
+                for chunk in stream.text_stream:
+                    yield 'data: ' + _json.dumps({'delta': chunk}) + '\n\n'
+            yield 'data: ' + _json.dumps({'done': True}) + '\n\n'
+        except Exception as e:
+            yield 'data: ' + _json.dumps({'error': str(e)}) + '\n\n'
+
+    return Response(
+        gen(),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+    )
+
+
+WEATHER_TTL = 600  # Open-Meteo updates ~hourly; 10 min is plenty fresh
+_weather_cache = {'data': None, 'ts': 0, 'etag': None}
+_weather_lock = threading.Lock()
 
 WMO_ICONS = {
     0: ('☀️', 'Clear'),
@@ -1422,13 +1958,31 @@ WMO_ICONS = {
     95: ('⛈️', 'Thunderstorm'), 96: ('⛈️', 'Thunderstorm'), 99: ('⛈️', 'Thunderstorm'),
 }
 
+# Dense code → (icon, description) table; WMO codes are 0-99, so the
+# hourly loop indexes a tuple instead of hashing into the dict
+_WMO_BY_CODE = tuple(WMO_ICONS.get(c, ('🌡️', 'Unknown')) for c in range(100))
 
-@app.route('/api/weather')
-def api_weather():
-    import time, requests as _req
-    now_ts = time.time()
-    if _weather_cache['data'] and now_ts - _weather_cache['ts'] < 1800:
-        return jsonify(_weather_cache['data'])
+
+def _wmo_icon(code):
+    if isinstance(code, int) and 0 <= code < 100:
+        return _WMO_BY_CODE[code]
+    return ('🌡️', 'Unknown')
+
+
+def _weather_payload():
+    if _weather_cache['data'] and time.monotonic() - _weather_cache['ts'] < WEATHER_TTL:
+        return _weather_cache['data']
+    # Single-flight: concurrent misses queue here and the losers return
+    # the winner's freshly cached payload
+    with _weather_lock:
+        now_ts = time.monotonic()
+        if _weather_cache['data'] and now_ts - _weather_cache['ts'] < WEATHER_TTL:
+            return _weather_cache['data']
+        return _fetch_weather(now_ts)
+
+
+def _fetch_weather(now_ts):
+    import requests as _req
     try:
         url = (
             'https://api.open-meteo.com/v1/forecast'
@@ -1439,37 +1993,42 @@ def api_weather():
             '&timezone=America%2FLos_Angeles'
             '&forecast_days=2'
         )
-        r = _req.get(url, timeout=8)
+        # Conditional GET: when upstream still has the same payload it
+        # answers 304 with ~0 bytes and we just refresh the clock
+        headers = {}
+        if _weather_cache['etag']:
+            headers['If-None-Match'] = _weather_cache['etag']
+        r = _req.get(url, timeout=8, headers=headers)
+        if r.status_code == 304 and _weather_cache['data']:
+            _weather_cache['ts'] = now_ts
+            return _weather_cache['data']
         d = r.json()
 
         cur = d['current']
         code = cur.get('weathercode', 0)
-        icon, desc = WMO_ICONS.get(code, ('🌡️', 'Unknown'))
+        icon, desc = _wmo_icon(code)
         temp = round(cur['temperature_2m'])
 
-        # Hourly — next 9 hours starting from current hour
+        # Hourly — next 9 hours starting from current hour. The series
+        # begins at local midnight (timezone param), so the current hour
+        # is just an index: no per-entry ISO parsing or date compares.
         hourly = d['hourly']
-        from datetime import datetime as _dt
-        local_now = _dt.now()
+        local_now = datetime.now()
         cur_hour = local_now.hour
 
         hours_out = []
-        count = 0
-        for i, t_str in enumerate(hourly['time']):
-            t = _dt.fromisoformat(t_str)
-            if t.date() == local_now.date() and t.hour >= cur_hour and count < 9:
-                h_code = hourly['weathercode'][i]
-                h_icon, _ = WMO_ICONS.get(h_code, ('🌡️', ''))
-                rain = hourly['precipitation_probability'][i] or 0
-                label = t.strftime('%-I %p').lower()
-                hours_out.append({
-                    'hour': t.hour,
-                    'label': label,
-                    'temp': round(hourly['temperature_2m'][i]),
-                    'rain': rain,
-                    'icon': h_icon,
-                })
-                count += 1
+        end_idx = min(cur_hour + 9, 24, len(hourly['time']))
+        for i in range(cur_hour, end_idx):
+            h_icon, _ = _wmo_icon(hourly['weathercode'][i])
+            rain = hourly['precipitation_probability'][i] or 0
+            label = local_now.replace(hour=i, minute=0).strftime('%-I %p').lower()
+            hours_out.append({
+                'hour': i,
+                'label': label,
+                'temp': round(hourly['temperature_2m'][i]),
+                'rain': rain,
+                'icon': h_icon,
+            })
 
         result = {
             'temp': temp,
@@ -1480,12 +2039,79 @@ def api_weather():
         }
         _weather_cache['data'] = result
         _weather_cache['ts'] = now_ts
-        return jsonify(result)
+        _weather_cache['etag'] = r.headers.get('ETag')
+        return result
     except Exception as e:
-        return jsonify({'error': str(e)})
+        return {'error': str(e)}
+
+
+@app.route('/api/weather')
+@etagged
+async def api_weather():
+    return jsonify(await _offload(_weather_payload))
+
+
+def _refresh_anchor_tasks():
+    claude_md = os.path.expanduser('~/.claude/CLAUDE.md')
+    with _db_lock:
+        if not _source_changed('claude_md', claude_md):
+            return
+        items = parse_anchor_tasks()
+        _db.execute("DELETE FROM anchor_tasks")
+        _db.executemany(
+            "INSERT INTO anchor_tasks (title, status) VALUES (?, ?)",
+            [(i['title'], i['status']) for i in items])
+        _db.commit()
+
+
+def _anchor_payload():
+    try:
+        _refresh_anchor_tasks()
+        with _db_lock:
+            rows = _db.execute(
+                "SELECT title, status FROM anchor_tasks ORDER BY seq").fetchall()
+        return {'tasks': [{'title': t, 'status': s} for t, s in rows]}
+    except Exception as e:
+        print(f"Could not load anchor tasks: {e}")
+        return {'tasks': parse_anchor_tasks()}
+
+
+# Which payloads each bootstrap slice gathers: 'main' is the critical
+# first paint (tasks + calendar), 'side' is the idle-loaded column
+_BOOTSTRAP_SLICES = {
+    'main': ('tasks', 'calendar'),
+    'side': ('decisions', 'anchor_tasks', 'weather'),
+}
+_BOOTSTRAP_BUILDERS = {
+    'tasks': lambda: _cached_payload('tasks', _tasks_payload),
+    'calendar': lambda: _cached_payload('calendar', _calendar_payload),
+    'decisions': lambda: _cached_payload('decisions', _decisions_payload),
+    'anchor_tasks': lambda: _cached_payload('anchor', _anchor_payload),
+    'weather': _weather_payload,
+}
+
+
+@app.route('/api/bootstrap')
+@etagged
+async def api_bootstrap():
+    """Batched payloads in one round trip.
+
+    ?only=main / ?only=side narrows to the critical or deferred slice so
+    the weather fetch can't delay first paint.
+    """
+    keys = _BOOTSTRAP_SLICES.get(
+        request.args.get('only'),
+        _BOOTSTRAP_SLICES['main'] + _BOOTSTRAP_SLICES['side'])
+    values = await asyncio.gather(
+        *[_offload(_BOOTSTRAP_BUILDERS[k]) for k in keys])
+    return jsonify(dict(zip(keys, values)))
 
 
 if __name__ == '__main__':
     port = int(os.environ.get('DASHBOARD_PORT', 5010))
     print(f"Helm Dashboard → http://localhost:{port}")
-    app.run(host='0.0.0.0', port=port, debug=False)
+    # Dev entrypoint only — threaded so one slow Google call can't stall
+    # the page load, reloader off. For a real deploy front it with
+    # gunicorn, matching the webhook service:
+    #   gunicorn dashboard:app --threads 8 --bind 0.0.0.0:5010
+    app.run(host='0.0.0.0', port=port, debug=False, threaded=True, use_reloader=False)
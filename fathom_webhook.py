@@ -11,11 +11,37 @@ Endpoints:
 """
 import os
 import hmac
+import time
+import queue
 import hashlib
 import json
+import itertools
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from flask import Flask, request, jsonify
 
+# orjson for the JSON-in-cell attendees/action_items columns — C-level
+# parse/serialize with a silent stdlib fallback
+try:
+    import orjson
+
+    def _loads(s):
+        return orjson.loads(s)
+
+    def _dumps(obj):
+        return orjson.dumps(obj).decode()
+
+    def _dumps_bytes(obj):
+        return orjson.dumps(obj)
+except ImportError:
+    _loads = json.loads
+    _dumps = json.dumps
+
+    def _dumps_bytes(obj):
+        return json.dumps(obj).encode()
+
 # Import transcript processor for signal extraction
 try:
     from transcript_processor import process_meeting
@@ -34,23 +60,75 @@ except ImportError:
 
 app = Flask(__name__)
 
+# orjson-backed jsonify (matching the dashboard) — meeting payloads are
+# nested lists-of-dicts where the stdlib encoder is the slow path
+try:
+    import orjson as _orjson
+    from flask.json.provider import JSONProvider
+
+    class ORJSONProvider(JSONProvider):
+        def dumps(self, obj, **kwargs):
+            return _orjson.dumps(obj).decode()
+
+        def loads(self, s, **kwargs):
+            return _orjson.loads(s)
+
+    app.json = ORJSONProvider(app)
+except ImportError:
+    # Stdlib fallback shouldn't pay a per-response key sort. (Flask 2.3+
+    # dropped the JSON_SORT_KEYS config key — the provider attribute is
+    # the only switch that still works.)
+    app.json.sort_keys = False
+
 WEBHOOK_SECRET = os.environ.get('FATHOM_WEBHOOK_SECRET', '')
 
+# Keep the full raw payload only when explicitly debugging — it pins a
+# second copy of every transcript in memory otherwise
+STORE_RAW = os.environ.get('FATHOM_STORE_RAW', '0') == '1'
+
+# Fields the read endpoints expose (everything but raw_data)
+_PUBLIC_KEYS = ('id', 'event_type', 'received_at', 'title', 'duration_seconds',
+                'attendees', 'summary', 'action_items', 'transcript',
+                'recording_url')
+
+
+def _attach_public_json(meeting):
+    """Serialize the public view once at insert — records are immutable
+    afterwards, so /meetings can just concatenate cached bytes."""
+    meeting['_public_json'] = _dumps_bytes(
+        {k: meeting[k] for k in _PUBLIC_KEYS if k in meeting})
+    return meeting
+_WEBHOOK_KEY = WEBHOOK_SECRET.encode()  # encoded once for the HMAC path
+
 # Meetings log sheet — create one sheet to store all meetings persistently
 MEETINGS_SHEET_ID = os.environ.get('MEETINGS_SHEET_ID', '')
 
-# In-memory cache (loaded from Sheets on startup)
-meetings_store = []
+# In-memory cache (loaded from Sheets on startup). A bounded deque gives
+# O(1) append-with-eviction; meetings_by_id mirrors it for O(1) lookup.
 MAX_MEETINGS = 100
+meetings_store = deque(maxlen=MAX_MEETINGS)
+meetings_by_id = {}
+
+
+_sheets_service = None
 
 
 def get_sheets_service():
+    """Sheets API service, built once per process.
+
+    static_discovery skips the discovery-document HTTP fetch entirely;
+    the credentials refresh themselves on the cached service.
+    """
+    global _sheets_service
     if not SHEETS_AVAILABLE:
         return None
-    creds = get_credentials()
-    if not creds:
-        return None
-    return build('sheets', 'v4', credentials=creds)
+    if _sheets_service is None:
+        creds = get_credentials()
+        if not creds:
+            return None
+        _sheets_service = build('sheets', 'v4', credentials=creds,
+                                static_discovery=True)
+    return _sheets_service
 
 
 def load_meetings_from_sheets():
@@ -61,21 +139,31 @@ def load_meetings_from_sheets():
         service = get_sheets_service()
         if not service:
             return []
+        # Count rows via the cheap id column, then fetch only the tail
+        # window instead of transferring the whole sheet and slicing.
+        ids = service.spreadsheets().values().get(
+            spreadsheetId=MEETINGS_SHEET_ID,
+            range='Meetings!A1:A'
+        ).execute().get('values', [])
+        total = len(ids)
+        if total < 2:
+            return []
+        start = max(2, total - MAX_MEETINGS + 1)
         result = service.spreadsheets().values().get(
             spreadsheetId=MEETINGS_SHEET_ID,
-            range='Meetings!A2:G'
+            range=f'Meetings!A{start}:G{total}'
         ).execute()
         rows = result.get('values', [])
         meetings = []
-        for row in rows[-MAX_MEETINGS:]:
+        for row in rows:
             if len(row) >= 4:
                 meetings.append({
                     'id': row[0] if len(row) > 0 else '',
                     'title': row[1] if len(row) > 1 else '',
                     'received_at': row[2] if len(row) > 2 else '',
-                    'attendees': json.loads(row[3]) if len(row) > 3 else [],
+                    'attendees': _loads(row[3]) if len(row) > 3 else [],
                     'summary': row[4] if len(row) > 4 else '',
-                    'action_items': json.loads(row[5]) if len(row) > 5 else [],
+                    'action_items': _loads(row[5]) if len(row) > 5 else [],
                     'recording_url': row[6] if len(row) > 6 else '',
                 })
         print(f"Loaded {len(meetings)} meetings from Sheets")
@@ -85,51 +173,124 @@ def load_meetings_from_sheets():
         return []
 
 
-def save_meeting_to_sheets(meeting):
-    """Append a single meeting row to Google Sheets."""
-    if not MEETINGS_SHEET_ID:
+def _meeting_row(meeting):
+    return [
+        meeting.get('id', ''),
+        meeting.get('title', ''),
+        meeting.get('received_at', ''),
+        _dumps(meeting.get('attendees', [])),
+        meeting.get('summary', '')[:500],
+        _dumps(meeting.get('action_items', [])),
+        meeting.get('recording_url', ''),
+    ]
+
+
+# Buffered Sheets writer — the webhook handler enqueues a row and
+# returns immediately; a daemon thread appends batches so requests never
+# pay the Sheets round trip.
+_pending_rows = queue.Queue()
+FLUSH_INTERVAL = 5
+FLUSH_BATCH = 10
+
+
+def _flush_rows(rows):
+    if not rows:
         return
     try:
         service = get_sheets_service()
         if not service:
             return
-        row = [
-            meeting.get('id', ''),
-            meeting.get('title', ''),
-            meeting.get('received_at', ''),
-            json.dumps(meeting.get('attendees', [])),
-            meeting.get('summary', '')[:500],
-            json.dumps(meeting.get('action_items', [])),
-            meeting.get('recording_url', ''),
-        ]
         service.spreadsheets().values().append(
             spreadsheetId=MEETINGS_SHEET_ID,
             range='Meetings!A:G',
             valueInputOption='RAW',
-            body={'values': [row]}
+            body={'values': rows}
         ).execute()
-        print(f"  Saved meeting to Sheets: {meeting.get('title')}")
+        print(f"  Saved {len(rows)} meeting(s) to Sheets")
     except Exception as e:
         print(f"  Could not save to Sheets: {e}")
 
 
+def _sheets_writer():
+    while True:
+        rows = [_pending_rows.get()]
+        deadline = time.time() + FLUSH_INTERVAL
+        while len(rows) < FLUSH_BATCH:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
+            try:
+                rows.append(_pending_rows.get(timeout=remaining))
+            except queue.Empty:
+                break
+        _flush_rows(rows)
+
+
+# Started lazily on first save: under gunicorn --preload the module is
+# imported in the master, and a thread started at import time would not
+# survive the fork — workers would enqueue rows nobody flushes.
+_writer_started = False
+_writer_lock = threading.Lock()
+
+
+def _ensure_writer():
+    global _writer_started
+    if _writer_started:
+        return
+    with _writer_lock:
+        if not _writer_started:
+            threading.Thread(
+                target=_sheets_writer, daemon=True, name='sheets-writer').start()
+            _writer_started = True
+
+
+def save_meeting_to_sheets(meeting):
+    """Queue a meeting row for the background Sheets writer."""
+    if not MEETINGS_SHEET_ID:
+        return
+    _ensure_writer()
+    _pending_rows.put(_meeting_row(meeting))
+
+# Transcript processing happens off the request path — Fathom gets its
+# 200 in milliseconds instead of waiting on the signal-extraction pass.
+# One worker only: process_meeting does an unsynchronized read-modify-
+# write of memory.json, so runs must stay serialized (as they were when
+# this ran inline on a single-threaded server).
+_processor_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='processor')
+
+
+def _process_in_background(meeting_record):
+    try:
+        processed = process_meeting(meeting_record)
+        signals = processed.get('signals', {})
+        action_count = len(signals.get('actions_for_me', [])) + len(signals.get('follow_ups', []))
+        print(f"  Extracted {action_count} action items, {len(signals.get('decisions', []))} decisions")
+    except Exception as e:
+        print(f"  Processor error: {e}")
+
+
 # Load existing meetings on startup
-meetings_store = load_meetings_from_sheets()
+meetings_store.extend(_attach_public_json(m) for m in load_meetings_from_sheets())
+meetings_by_id = {m['id']: m for m in meetings_store}
 
 
 def verify_signature(payload, signature):
-    """Verify Fathom webhook signature."""
-    if not WEBHOOK_SECRET:
-        print("Warning: No webhook secret configured, skipping verification")
-        return True
+    """Verify Fathom webhook signature.
 
+    Only called when a secret is configured (the route checks), so the
+    no-secret branch lives there rather than on this hot path.
+    """
     try:
-        expected = hmac.new(
-            WEBHOOK_SECRET.encode(),
-            payload,
-            hashlib.sha256
-        ).hexdigest()
-        return hmac.compare_digest(f"sha256={expected}", signature)
+        if not signature.startswith('sha256='):
+            return False
+        # Compare raw bytes via the one-shot hmac.digest fast path — no
+        # hex encoding or prefix string per request
+        try:
+            sig_bytes = bytes.fromhex(signature[7:])
+        except ValueError:
+            return False  # malformed hex isn't an error worth logging
+        expected = hmac.digest(_WEBHOOK_KEY, payload, 'sha256')
+        return hmac.compare_digest(expected, sig_bytes)
     except Exception as e:
         print(f"Signature verification error: {e}")
         return False
@@ -144,7 +305,13 @@ def fathom_webhook():
         print("Invalid webhook signature")
         return jsonify({"error": "Invalid signature"}), 401
 
-    data = request.json
+    # Parse the body we already verified, via orjson when present —
+    # request.json would re-route through the provider anyway, but this
+    # skips Flask's mimetype negotiation on the hot path
+    try:
+        data = _loads(request.data)
+    except Exception:
+        return jsonify({"error": "Invalid JSON body"}), 400
     event_type = data.get('type', 'unknown')
 
     print(f"[{datetime.now().strftime('%H:%M:%S')}] Fathom event: {event_type}")
@@ -165,29 +332,26 @@ def fathom_webhook():
         "action_items": meeting_data.get('action_items', meeting_data.get('actionItems', [])),
         "transcript": meeting_data.get('transcript', ''),
         "recording_url": meeting_data.get('recording_url', meeting_data.get('recordingUrl', '')),
-        "raw_data": data  # Store full payload for debugging
     }
-
-    # Add to store and persist to Sheets
+    if STORE_RAW:
+        meeting_record['raw_data'] = data  # Full payload for debugging
+
+    # Add to store and persist to Sheets; the deque evicts the oldest
+    # automatically once full
+    if len(meetings_store) == MAX_MEETINGS:
+        meetings_by_id.pop(meetings_store[0]['id'], None)
+    _attach_public_json(meeting_record)
     meetings_store.append(meeting_record)
+    meetings_by_id[meeting_record['id']] = meeting_record
     save_meeting_to_sheets(meeting_record)
 
-    # Trim to max size
-    while len(meetings_store) > MAX_MEETINGS:
-        meetings_store.pop(0)
-
     print(f"  Stored meeting: {meeting_record['title']}")
     print(f"  Total meetings stored: {len(meetings_store)}")
 
     # Process transcript for signals (action items, decisions, etc.)
+    # in the background — don't make Fathom wait on it
     if PROCESSOR_AVAILABLE:
-        try:
-            processed = process_meeting(meeting_record)
-            signals = processed.get('signals', {})
-            action_count = len(signals.get('actions_for_me', [])) + len(signals.get('follow_ups', []))
-            print(f"  Extracted {action_count} action items, {len(signals.get('decisions', []))} decisions")
-        except Exception as e:
-            print(f"  Processor error: {e}")
+        _processor_pool.submit(_process_in_background, meeting_record)
 
     return jsonify({"status": "ok", "meeting_id": meeting_record['id']})
 
@@ -195,19 +359,20 @@ def fathom_webhook():
 @app.route('/meetings', methods=['GET'])
 def list_meetings():
     """List recent meetings."""
-    # Return without raw_data to keep response small
-    return jsonify([
-        {k: v for k, v in m.items() if k != 'raw_data'}
-        for m in reversed(meetings_store[-20:])
-    ])
+    # Concatenate the per-record bytes cached at insert — no dict
+    # rebuilding or re-serialization per request
+    body = b'[' + b','.join(
+        m['_public_json'] for m in itertools.islice(reversed(meetings_store), 20)
+    ) + b']'
+    return app.response_class(body, mimetype='application/json')
 
 
 @app.route('/meetings/<meeting_id>', methods=['GET'])
 def get_meeting(meeting_id):
     """Get specific meeting by ID."""
-    for m in meetings_store:
-        if m['id'] == meeting_id:
-            return jsonify(m)
+    m = meetings_by_id.get(meeting_id)
+    if m is not None:
+        return jsonify({k: v for k, v in m.items() if k != '_public_json'})
     return jsonify({"error": "Meeting not found"}), 404
 
 
@@ -216,7 +381,7 @@ def get_latest():
     """Get the most recent meeting."""
     if meetings_store:
         m = meetings_store[-1]
-        return jsonify({k: v for k, v in m.items() if k != 'raw_data'})
+        return app.response_class(m['_public_json'], mimetype='application/json')
     return jsonify({"error": "No meetings yet"}), 404
 
 
@@ -274,4 +439,6 @@ if __name__ == '__main__':
     print(f"Webhook secret: {'configured' if WEBHOOK_SECRET else 'NOT SET'}")
     print(f"Listening on port {port}")
     print("=" * 50)
-    app.run(host='0.0.0.0', port=port, debug=True)
+    # Dev entrypoint only — production runs under gunicorn (Procfile).
+    # debug=True also enabled the reloader, doubling startup work.
+    app.run(host='0.0.0.0', port=port, debug=False, threaded=True)
@@ -5,16 +5,33 @@ Read today's meetings, check for scheduled events, create events.
 """
 
 from datetime import datetime, timedelta
-from googleapiclient.discovery import build
 from google_auth import get_credentials
 
+# Partial-response mask: only the event fields _format_event consumes.
+# Cuts the JSON Google sends (and we parse) several-fold per event.
+EVENT_FIELDS = ('nextPageToken,items(id,summary,description,start,end,'
+                'attendees(self,displayName,email),htmlLink,colorId)')
+
+
+_service = None
+
 
 def get_calendar_service():
-    """Get authenticated Calendar API service."""
-    creds = get_credentials()
-    if not creds:
-        return None
-    return build('calendar', 'v3', credentials=creds)
+    """Get authenticated Calendar API service (built once per process).
+
+    The discovery document fetch and HTTPS setup are paid on first use
+    only; the credentials object refreshes itself on the cached service.
+    """
+    global _service
+    if _service is None:
+        # Deferred import: googleapiclient drags in a large transitive
+        # graph that callers of this module may never need
+        from googleapiclient.discovery import build
+        creds = get_credentials()
+        if not creds:
+            return None
+        _service = build('calendar', 'v3', credentials=creds)
+    return _service
 
 
 def get_todays_events():
@@ -34,7 +51,8 @@ def get_todays_events():
             timeMin=start_of_day.isoformat() + 'Z',
             timeMax=end_of_day.isoformat() + 'Z',
             singleEvents=True,
-            orderBy='startTime'
+            orderBy='startTime',
+            fields=EVENT_FIELDS
         ).execute()
 
         events = events_result.get('items', [])
@@ -60,7 +78,8 @@ def get_upcoming_events(days=7):
             timeMin=now.isoformat() + 'Z',
             timeMax=end.isoformat() + 'Z',
             singleEvents=True,
-            orderBy='startTime'
+            orderBy='startTime',
+            fields=EVENT_FIELDS
         ).execute()
 
         events = events_result.get('items', [])
@@ -71,6 +90,62 @@ def get_upcoming_events(days=7):
         return []
 
 
+def get_today_and_upcoming_events(days=7):
+    """Fetch today's events and the next N days in one batched round trip.
+
+    Returns (today_events, upcoming_events) — the same payloads as
+    get_todays_events() + get_upcoming_events(), but both events.list
+    calls ride Google's batch endpoint.
+    """
+    service = get_calendar_service()
+    if not service:
+        return [], []
+
+    now = datetime.now()
+    start_of_day = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    end_of_day = start_of_day + timedelta(days=1)
+    end = now + timedelta(days=days)
+
+    responses = {}
+
+    def _collect(request_id, response, exception):
+        if exception is None:
+            responses[request_id] = response
+
+    try:
+        batch = service.new_batch_http_request(callback=_collect)
+        batch.add(
+            service.events().list(
+                calendarId='primary',
+                timeMin=start_of_day.isoformat() + 'Z',
+                timeMax=end_of_day.isoformat() + 'Z',
+                singleEvents=True,
+                orderBy='startTime',
+                fields=EVENT_FIELDS
+            ),
+            request_id='today',
+        )
+        batch.add(
+            service.events().list(
+                calendarId='primary',
+                timeMin=now.isoformat() + 'Z',
+                timeMax=end.isoformat() + 'Z',
+                singleEvents=True,
+                orderBy='startTime',
+                fields=EVENT_FIELDS
+            ),
+            request_id='upcoming',
+        )
+        batch.execute()
+    except Exception as e:
+        print(f"Error fetching calendar: {e}")
+        return [], []
+
+    today_events = [_format_event(e) for e in responses.get('today', {}).get('items', [])]
+    upcoming = [_format_event(e) for e in responses.get('upcoming', {}).get('items', [])]
+    return today_events, upcoming
+
+
 def find_event(query, days_ahead=14):
     """Search for an event by text in title/description."""
     service = get_calendar_service()
@@ -130,30 +205,35 @@ def create_event(title, start_time, duration_minutes=30, description='', attende
         event['attendees'] = [{'email': a} for a in attendees]
 
     try:
-        created = service.events().insert(calendarId='primary', body=event).execute()
+        created = service.events().insert(
+            calendarId='primary', body=event,
+            fields='id,summary,description,start,end,attendees(self,displayName,email),htmlLink,colorId'
+        ).execute()
         return _format_event(created)
     except Exception as e:
         print(f"Error creating event: {e}")
         return None
 
 
+# _format_event constants — hoisted out of the per-event hot loop
+_EMPTY = {}
+_TIME_FMT = '%I:%M %p'
+_DATE_FMT = '%Y-%m-%d'
+
+
 def _format_event(event):
     """Format a calendar event for internal use."""
-    start = event.get('start', {})
-    end = event.get('end', {})
+    g = event.get
+    fromiso = datetime.fromisoformat
+    start = g('start', _EMPTY)
+    end = g('end', _EMPTY)
     start_raw = start.get('dateTime', start.get('date', ''))
     end_raw = end.get('dateTime', end.get('date', ''))
 
-    start_iso = ''
-    end_iso = ''
-    time_str = ''
-    end_time_str = ''
-    date_str = ''
-
     if 'T' in start_raw:
-        dt = datetime.fromisoformat(start_raw.replace('Z', '+00:00'))
-        time_str = dt.strftime('%I:%M %p').lstrip('0')
-        date_str = dt.strftime('%Y-%m-%d')
+        dt = fromiso(start_raw.replace('Z', '+00:00'))
+        time_str = dt.strftime(_TIME_FMT).lstrip('0')
+        date_str = dt.strftime(_DATE_FMT)
         start_iso = dt.isoformat()
     else:
         time_str = 'All day'
@@ -161,33 +241,38 @@ def _format_event(event):
         start_iso = start_raw
 
     if 'T' in end_raw:
-        end_dt = datetime.fromisoformat(end_raw.replace('Z', '+00:00'))
-        end_time_str = end_dt.strftime('%I:%M %p').lstrip('0')
+        end_dt = fromiso(end_raw.replace('Z', '+00:00'))
+        end_time_str = end_dt.strftime(_TIME_FMT).lstrip('0')
         end_iso = end_dt.isoformat()
     else:
+        end_time_str = ''
         end_iso = end_raw
 
-    # Build attendee display names (skip self)
+    # One pass over attendees for both the email list and the display
+    # names (skip self in the latter)
+    attendees = []
     attendees_display = []
-    for a in event.get('attendees', []):
+    for a in g('attendees', ()):
+        email = a.get('email', '')
+        attendees.append(email)
         if a.get('self'):
             continue
-        name = a.get('displayName') or a.get('email', '').split('@')[0].replace('.', ' ').title()
-        attendees_display.append(name)
+        attendees_display.append(
+            a.get('displayName') or email.split('@', 1)[0].replace('.', ' ').title())
 
     return {
-        'id': event.get('id'),
-        'title': event.get('summary', 'No title'),
+        'id': g('id'),
+        'title': g('summary', 'No title'),
         'date': date_str,
         'time': time_str,
         'end_time': end_time_str,
         'start_iso': start_iso,
         'end_iso': end_iso,
-        'description': event.get('description', ''),
-        'attendees': [a.get('email', '') for a in event.get('attendees', [])],
+        'description': g('description', ''),
+        'attendees': attendees,
         'attendees_display': attendees_display,
-        'link': event.get('htmlLink', ''),
-        'color_id': event.get('colorId', ''),  # Empty string = calendar default (keep)
+        'link': g('htmlLink', ''),
+        'color_id': g('colorId', ''),  # Empty string = calendar default (keep)
     }
 
 
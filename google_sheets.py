@@ -5,7 +5,8 @@ Monitors Q1 Support Team Project Tracker and linked docs.
 """
 
 import re
-from googleapiclient.discovery import build
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from google_auth import get_credentials
 
 # Q1 Support Project Tracker
@@ -16,15 +17,47 @@ Q1_SHEET_GID = "292880445"
 GTM_SPREADSHEET_ID = "1tE8MjoKgReHosmjksADzcJqCRXto90G4-ShBHJWCy9s"
 GTM_TAB = "Spring GTM-UX MVP"
 
+# Google Doc/Sheet links in tracker cells — the capture group keeps the
+# kind so the per-link substring probes go away
+_DOC_RE = re.compile(r'https://docs\.google\.com/(document|spreadsheets)/d/([a-zA-Z0-9_-]+)')
 
-def get_sheets_service():
-    """Get authenticated Sheets API service."""
+# Closed/done status markers — one C-level scan per project instead of
+# five Python-level substring tests. The GTM tracker only ever marks
+# items 'Complete', so it keeps its own narrower pattern.
+_CLOSED_RE = re.compile(r'complete|done|closed|cancell?ed', re.I)
+_GTM_DONE_RE = re.compile(r'complete', re.I)
+
+
+_service = None
+
+
+def _build_sheets_service():
+    """Construct a fresh Sheets service (no cache).
+
+    Needed for concurrent use: a service's underlying httplib2 transport
+    is not safe for simultaneous .execute() calls from two threads.
+    """
+    # Deferred import: googleapiclient drags in a large transitive
+    # graph that callers of this module may never need
+    from googleapiclient.discovery import build
     creds = get_credentials()
     if not creds:
         return None
     return build('sheets', 'v4', credentials=creds)
 
 
+def get_sheets_service():
+    """Get authenticated Sheets API service (built once per process).
+
+    The discovery document fetch and HTTPS setup are paid on first use
+    only; the credentials object refreshes itself on the cached service.
+    """
+    global _service
+    if _service is None:
+        _service = _build_sheets_service()
+    return _service
+
+
 def get_spreadsheet_data(spreadsheet_id=Q1_SPREADSHEET_ID, range_name='A:Z'):
     """Get data from a spreadsheet."""
     service = get_sheets_service()
@@ -42,20 +75,24 @@ def get_spreadsheet_data(spreadsheet_id=Q1_SPREADSHEET_ID, range_name='A:Z'):
         return []
 
 
-def get_q1_projects():
-    """Get projects from Q1 tracker with their status and linked docs."""
+def _iter_q1_projects():
+    """Yield projects from the Q1 tracker one at a time.
+
+    The public helpers chain filters over this and materialize a single
+    list at the end, so the row data is walked once with no per-stage
+    intermediate lists.
+    """
     rows = get_spreadsheet_data(Q1_SPREADSHEET_ID)
     if not rows:
-        return []
+        return
 
-    projects = []
-    headers = rows[0] if rows else []
+    headers_lc = [h.lower() for h in rows[0]]
 
-    # Find column indices
+    # Find column indices (headers lowered once, not per comparison)
     def find_col(names):
         for name in names:
-            for i, h in enumerate(headers):
-                if name.lower() in h.lower():
+            for i, h in enumerate(headers_lc):
+                if name in h:
                     return i
         return -1
 
@@ -66,83 +103,103 @@ def get_q1_projects():
     col_link_e = 4  # Column E (0-indexed)
     col_link_f = 5  # Column F (0-indexed)
 
+    # Pad each short row once so the loop indexes directly instead of
+    # bounds-checking every column read
+    max_col = max(c for c in (col_project, col_status, col_owner, col_due,
+                              col_link_e, col_link_f))
+
     for row in rows[1:]:  # Skip header
         if len(row) <= col_project or not row[col_project].strip():
             continue
 
+        if len(row) <= max_col:
+            row = row + [''] * (max_col + 1 - len(row))
+
         project = {
-            'name': row[col_project] if col_project >= 0 and len(row) > col_project else '',
-            'status': row[col_status] if col_status >= 0 and len(row) > col_status else '',
-            'owner': row[col_owner] if col_owner >= 0 and len(row) > col_owner else '',
-            'due': row[col_due] if col_due >= 0 and len(row) > col_due else '',
+            'name': row[col_project] if col_project >= 0 else '',
+            'status': row[col_status] if col_status >= 0 else '',
+            'owner': row[col_owner] if col_owner >= 0 else '',
+            'due': row[col_due] if col_due >= 0 else '',
             'linked_docs': [],
         }
 
         # Extract links from columns E and F
-        for col_idx in [col_link_e, col_link_f]:
-            if len(row) > col_idx and row[col_idx]:
-                links = extract_doc_links(row[col_idx])
-                project['linked_docs'].extend(links)
+        for col_idx in (col_link_e, col_link_f):
+            if row[col_idx]:
+                project['linked_docs'].extend(extract_doc_links(row[col_idx]))
 
         if project['name']:
-            projects.append(project)
+            yield project
+
 
-    return projects
+def get_q1_projects():
+    """Get projects from Q1 tracker with their status and linked docs."""
+    return list(_iter_q1_projects())
 
 
 def extract_doc_links(cell_value):
     """Extract Google Doc/Sheet links from a cell."""
-    links = []
-    # Match Google Docs/Sheets URLs
-    pattern = r'https://docs\.google\.com/(?:document|spreadsheets)/d/([a-zA-Z0-9_-]+)'
-    matches = re.findall(pattern, str(cell_value))
-    for doc_id in matches:
-        links.append({
-            'type': 'document' if 'document' in cell_value else 'spreadsheet',
+    return [
+        {
+            'type': 'document' if kind == 'document' else 'spreadsheet',
             'id': doc_id,
-            'url': f"https://docs.google.com/document/d/{doc_id}" if 'document' in cell_value else f"https://docs.google.com/spreadsheets/d/{doc_id}"
-        })
-    return links
-
+            'url': f"https://docs.google.com/{kind}/d/{doc_id}",
+        }
+        for kind, doc_id in _DOC_RE.findall(str(cell_value))
+    ]
 
-def get_open_projects():
-    """Get projects that aren't complete."""
-    projects = get_q1_projects()
-    open_projects = []
 
-    closed_statuses = ['complete', 'done', 'closed', 'cancelled', 'canceled']
+def _iter_open_projects():
+    return (p for p in _iter_q1_projects()
+            if not _CLOSED_RE.search(p['status'] or ''))
 
-    for p in projects:
-        status_lower = p['status'].lower() if p['status'] else ''
-        if not any(s in status_lower for s in closed_statuses):
-            open_projects.append(p)
 
-    return open_projects
+def get_open_projects():
+    """Get projects that aren't complete."""
+    return list(_iter_open_projects())
 
 
 def get_my_projects(my_name='lucas'):
     """Get projects owned by me."""
-    projects = get_open_projects()
-    return [p for p in projects if my_name.lower() in p['owner'].lower()]
+    my_name = my_name.lower()
+    return [p for p in _iter_open_projects() if my_name in p['owner'].lower()]
 
 
 def format_for_briefing(projects, max_items=5):
-    """Format projects for morning briefing."""
+    """Format projects for morning briefing (accepts any iterable)."""
     lines = []
-    for p in projects[:max_items]:
+    it = iter(projects)
+    for p in islice(it, max_items):
         status = f" [{p['status']}]" if p['status'] else ""
         due = f" (due: {p['due']})" if p['due'] else ""
         lines.append(f"• {p['name']}{status}{due}")
 
-    if len(projects) > max_items:
-        lines.append(f"  _...plus {len(projects) - max_items} more_")
+    remaining = sum(1 for _ in it)
+    if remaining:
+        lines.append(f"  _...plus {remaining} more_")
 
     return "\n".join(lines)
 
 
-def get_gtm_items(assignee_filter=None):
+def get_both_trackers():
+    """Fetch the Q1 and GTM trackers concurrently.
+
+    They live in different spreadsheets, so a single batchGet can't
+    combine them — two threads overlap the round trips instead, cutting
+    wall time roughly in half for callers that want both. The GTM thread
+    gets its own service instance so the two fetches never share one
+    httplib2 transport.
+    """
+    gtm_service = _build_sheets_service()
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        q1 = pool.submit(get_q1_projects)
+        gtm = pool.submit(get_gtm_items, service=gtm_service)
+        return q1.result(), gtm.result()
+
+
+def get_gtm_items(assignee_filter=None, service=None):
     """Get GTM tracking items, optionally filtered by assignee."""
-    service = get_sheets_service()
+    service = service or get_sheets_service()
     if not service:
         return []
 
@@ -168,7 +225,7 @@ def get_gtm_items(assignee_filter=None):
             due = row[6] if len(row) > 6 else ''
 
             # Skip completed items
-            if 'complete' in status.lower():
+            if _GTM_DONE_RE.search(status):
                 continue
 
             # Filter by assignee if specified
@@ -207,17 +264,20 @@ def get_my_gtm_items():
 if __name__ == '__main__':
     print("=== Q1 Support Project Tracker ===\n")
 
-    projects = get_q1_projects()
+    # One concurrent fetch of both trackers; open/mine derive from the
+    # list already in hand instead of re-hitting the sheet
+    projects, gtm_items = get_both_trackers()
     if not projects:
         print("No projects found (or not authenticated)")
         print(f"Spreadsheet ID: {Q1_SPREADSHEET_ID}")
     else:
         print(f"Found {len(projects)} projects\n")
 
-        open_projects = get_open_projects()
+        open_projects = [p for p in projects
+                         if not _CLOSED_RE.search(p['status'] or '')]
         print(f"Open projects: {len(open_projects)}")
 
-        my_projects = get_my_projects('lucas')
+        my_projects = [p for p in open_projects if 'lucas' in p['owner'].lower()]
         print(f"Lucas's projects: {len(my_projects)}\n")
 
         if my_projects:
@@ -233,3 +293,6 @@ if __name__ == '__main__':
                 print(f"    Owner: {p['owner']}")
             if p['linked_docs']:
                 print(f"    Linked docs: {len(p['linked_docs'])}")
+
+        print(f"\n=== GTM Tracker ===")
+        print(f"Open GTM items: {len(gtm_items)}")
@@ -5,16 +5,27 @@ Read task lists and tasks for morning briefing.
 """
 
 from datetime import datetime
+from functools import lru_cache
 from googleapiclient.discovery import build
 from google_auth import get_credentials
 
 
+_service = None
+
+
 def get_tasks_service():
-    """Get authenticated Tasks API service."""
-    creds = get_credentials()
-    if not creds:
-        return None
-    return build('tasks', 'v1', credentials=creds)
+    """Get authenticated Tasks API service (built once per process).
+
+    The discovery document fetch and HTTPS setup are paid on first use
+    only; the credentials object refreshes itself on the cached service.
+    """
+    global _service
+    if _service is None:
+        creds = get_credentials()
+        if not creds:
+            return None
+        _service = build('tasks', 'v1', credentials=creds)
+    return _service
 
 
 def get_task_lists():
@@ -55,15 +66,20 @@ def get_tasks(list_id='@default', show_completed=False):
 
 
 def get_all_open_tasks():
-    """Get all incomplete tasks across all lists."""
+    """Get all incomplete tasks across all lists (one batched fetch)."""
+    service = get_tasks_service()
+    if not service:
+        return []
+
     task_lists = get_task_lists()
-    all_tasks = []
+    raw_by_list = _fetch_all_lists(service, task_lists)
 
+    all_tasks = []
     for tl in task_lists:
-        tasks = get_tasks(tl['id'], show_completed=False)
-        for task in tasks:
+        for t in raw_by_list.get(tl['id'], []):
+            task = _format_task(t)
             task['list_name'] = tl['title']
-        all_tasks.extend(tasks)
+            all_tasks.append(task)
 
     # Sort by due date (tasks without due date go to end)
     all_tasks.sort(key=lambda t: t['due'] if t['due'] else '9999-99-99')
@@ -197,6 +213,68 @@ def categorize_tasks(tasks):
     return categorized
 
 
+def _build_categories(raw_tasks):
+    """Turn a flat task list into category dicts with their subtasks."""
+    # Build a map of task ID -> task
+    task_map = {t['id']: _format_task(t) for t in raw_tasks}
+
+    # Find top-level tasks (no parent) - these are categories
+    categories = []
+    subtask_ids = set()
+
+    for task in raw_tasks:
+        formatted = task_map[task['id']]
+        if formatted['parent']:
+            subtask_ids.add(task['id'])
+
+    # Sort raw_tasks by position to honour user-defined order
+    raw_tasks.sort(key=lambda t: t.get('position', ''))
+
+    # Build categories with their subtasks, preserving position order
+    for task in raw_tasks:
+        if task['id'] not in subtask_ids:
+            # This is a top-level task (category)
+            cat = {
+                'name': task_map[task['id']]['title'],
+                'id': task['id'],
+                'position': task.get('position', ''),
+                'tasks': []
+            }
+            # Find all direct children, preserving their position order
+            children = [
+                task_map[t['id']] for t in raw_tasks
+                if t.get('parent') == task['id']
+            ]
+            cat['tasks'] = children
+            categories.append(cat)
+
+    return categories
+
+
+def _fetch_all_pages(service, list_id, first_page=None):
+    """Collect every task in a list, following pagination as needed."""
+    raw_tasks = []
+    page_token = None
+    result = first_page
+    while True:
+        if result is None:
+            kwargs = dict(
+                tasklist=list_id,
+                showCompleted=False,
+                showHidden=False,
+                maxResults=100,
+            )
+            if page_token:
+                kwargs['pageToken'] = page_token
+            result = service.tasks().list(**kwargs).execute()
+        raw_tasks.extend(result.get('items', []))
+        page_token = result.get('nextPageToken')
+        if not page_token:
+            break
+        result = None
+    return raw_tasks
+
+
 def get_tasks_hierarchical(list_id='@default'):
     """Get tasks with hierarchy preserved, returning categories and their subtasks.
 
@@ -208,75 +286,82 @@ def get_tasks_hierarchical(list_id='@default'):
 
     try:
         # Fetch all tasks with pagination (default maxResults is 20, we need all)
-        raw_tasks = []
-        page_token = None
-        while True:
-            kwargs = dict(
-                tasklist=list_id,
-                showCompleted=False,
-                showHidden=False,
-                maxResults=100,
-            )
-            if page_token:
-                kwargs['pageToken'] = page_token
-            result = service.tasks().list(**kwargs).execute()
-            raw_tasks.extend(result.get('items', []))
-            page_token = result.get('nextPageToken')
-            if not page_token:
-                break
-
-        # Build a map of task ID -> task
-        task_map = {t['id']: _format_task(t) for t in raw_tasks}
-
-        # Find top-level tasks (no parent) - these are categories
-        categories = []
-        subtask_ids = set()
-
-        for task in raw_tasks:
-            formatted = task_map[task['id']]
-            if formatted['parent']:
-                subtask_ids.add(task['id'])
-
-        # Sort raw_tasks by position to honour user-defined order
-        raw_tasks.sort(key=lambda t: t.get('position', ''))
-
-        # Build categories with their subtasks, preserving position order
-        for task in raw_tasks:
-            formatted = task_map[task['id']]
-            if task['id'] not in subtask_ids:
-                # This is a top-level task (category)
-                cat = {
-                    'name': formatted['title'],
-                    'id': task['id'],
-                    'position': task.get('position', ''),
-                    'tasks': []
-                }
-                # Find all direct children, preserving their position order
-                children = [
-                    task_map[t['id']] for t in raw_tasks
-                    if t.get('parent') == task['id']
-                ]
-                cat['tasks'] = children
-                categories.append(cat)
-
-        return categories
+        raw_tasks = _fetch_all_pages(service, list_id)
+        return _build_categories(raw_tasks)
 
     except Exception as e:
         print(f"Error fetching hierarchical tasks: {e}")
         return []
 
 
+def _fetch_all_lists(service, task_lists):
+    """Fetch every list's open tasks in one batched HTTP round trip.
+
+    Returns {list_id: raw_tasks}. The per-list tasks().list calls ride
+    Google's batch endpoint, so N lists cost one round trip instead of N
+    (pagination beyond 100 tasks falls back to serial follow-ups, which
+    is rare).
+    """
+    if not task_lists:
+        return {}
+
+    first_pages = {}
+
+    def _collect(request_id, response, exception):
+        if exception is None:
+            first_pages[request_id] = response
+        else:
+            print(f"Error fetching tasks for list {request_id}: {exception}")
+
+    try:
+        batch = service.new_batch_http_request(callback=_collect)
+        for tl in task_lists:
+            batch.add(
+                service.tasks().list(
+                    tasklist=tl['id'],
+                    showCompleted=False,
+                    showHidden=False,
+                    maxResults=100,
+                ),
+                request_id=tl['id'],
+            )
+        batch.execute()
+    except Exception as e:
+        print(f"Error batch-fetching tasks: {e}")
+        return {}
+
+    return {
+        list_id: _fetch_all_pages(service, list_id, first_page=first_page)
+        for list_id, first_page in first_pages.items()
+    }
+
+
+def get_all_tasks_hierarchical():
+    """Fetch every list's tasks in one batched round trip, hierarchically.
+
+    Returns list of (task_list, categories) pairs.
+    """
+    service = get_tasks_service()
+    if not service:
+        return []
+
+    task_lists = get_task_lists()
+    raw_by_list = _fetch_all_lists(service, task_lists)
+    return [
+        (tl, _build_categories(raw_by_list[tl['id']]))
+        for tl in task_lists if tl['id'] in raw_by_list
+    ]
+
+
 def get_all_tasks_by_category():
     """Get all tasks organized by their parent category across all lists.
 
     Returns dict: {'CX': [task1, task2], 'Support': [task3, ...], ...}
     """
-    task_lists = get_task_lists()
     all_categories = {}
     uncategorized = []
 
-    for tl in task_lists:
-        categories = get_tasks_hierarchical(tl['id'])
+    for tl, categories in get_all_tasks_hierarchical():
         for cat in categories:
             if cat['tasks']:
                 # This category has subtasks
@@ -301,16 +386,21 @@ def get_all_tasks_by_category():
     return all_categories
 
 
+@lru_cache(maxsize=4096)
+def _parse_due(due):
+    """RFC 3339 due string -> YYYY-MM-DD (cached — due dates repeat)."""
+    try:
+        return datetime.fromisoformat(due.replace('Z', '+00:00')).strftime('%Y-%m-%d')
+    except ValueError:
+        return due  # Keep original string if parsing fails
+
+
 def _format_task(task):
     """Format a task for internal use."""
     due = task.get('due', '')
     if due:
         # Due dates come as RFC 3339 (e.g., '2024-01-15T00:00:00.000Z')
-        try:
-            dt = datetime.fromisoformat(due.replace('Z', '+00:00'))
-            due = dt.strftime('%Y-%m-%d')
-        except ValueError:
-            pass  # Keep original string if parsing fails
+        due = _parse_due(due)
 
     return {
         'id': task.get('id'),
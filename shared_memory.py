@@ -6,6 +6,14 @@ import json
 from datetime import datetime
 from pathlib import Path
 
+# orjson parses the memory files several times faster than stdlib json;
+# fall back silently when it isn't installed
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 MEMORY_DIR = Path(__file__).parent
 MEMORY_FILE = MEMORY_DIR / "memory.json"
 ENTITIES_FILE = MEMORY_DIR / "entities.json"
@@ -13,8 +21,8 @@ ENTITIES_FILE = MEMORY_DIR / "entities.json"
 
 def load_memory():
     """Load shared memory"""
-    with open(MEMORY_FILE) as f:
-        return json.load(f)
+    with open(MEMORY_FILE, 'rb') as f:
+        return _loads(f.read())
 
 
 def save_memory(data):
@@ -25,8 +33,8 @@ def save_memory(data):
 
 def load_entities():
     """Load entity tracking"""
-    with open(ENTITIES_FILE) as f:
-        return json.load(f)
+    with open(ENTITIES_FILE, 'rb') as f:
+        return _loads(f.read())
 
 
 def save_entities(data):